@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+
+from db.models import AnalyticsResponse, AnalyticsBucket, DailyStats, DailyStatsResponse
+from db.mongodb import get_collection
+from services.daily_stats import STATS_COLLECTION, stats_day
+from core.cache import TTLCache
+from core.config import settings
+
+router = APIRouter()
+
+# Dashboards refresh often; identical requests within the TTL share one aggregation
+_analytics_cache = TTLCache(ttl_seconds=settings.ANALYTICS_CACHE_SECONDS, max_entries=256)
+
+
+def build_analytics_pipeline(match: dict, bucket: str) -> list:
+    """One pass over the matched contracts, computing every dashboard figure in a $facet."""
+    return [
+        {"$match": match},
+        {"$facet": {
+            "by_status": [
+                {"$group": {"_id": "$processing_status", "count": {"$sum": 1}}},
+            ],
+            "completed": [
+                {"$match": {"processing_status": "completed"}},
+                {"$group": {
+                    "_id": None,
+                    "avg_confidence": {"$avg": "$avg_confidence"},
+                    "min_confidence": {"$min": "$min_confidence"},
+                    "avg_processing_seconds": {"$avg": "$processing_seconds"},
+                    "max_processing_seconds": {"$max": "$processing_seconds"},
+                    "avg_gaps": {"$avg": "$gaps_count"},
+                }},
+            ],
+            "gaps_by_field": [
+                {"$match": {"processing_status": "completed"}},
+                {"$unwind": "$identified_gaps"},
+                {"$group": {"_id": "$identified_gaps", "count": {"$sum": 1}}},
+            ],
+            "buckets": [
+                {"$group": {
+                    "_id": {"$dateTrunc": {"date": "$upload_timestamp", "unit": bucket}},
+                    "total": {"$sum": 1},
+                    "completed": {"$sum": {"$cond": [{"$eq": ["$processing_status", "completed"]}, 1, 0]}},
+                    "errors": {"$sum": {"$cond": [{"$eq": ["$processing_status", "error"]}, 1, 0]}},
+                    "avg_confidence": {"$avg": "$avg_confidence"},
+                    "avg_processing_seconds": {"$avg": "$processing_seconds"},
+                }},
+                {"$sort": {"_id": 1}},
+            ],
+        }},
+    ]
+
+
+@router.get("/analytics", response_model=AnalyticsResponse)
+async def get_analytics(
+    date_from: Optional[datetime] = Query(None, alias="dateFrom"),
+    date_to: Optional[datetime] = Query(None, alias="dateTo"),
+    bucket: str = Query("day", regex="^(day|week|month)$"),
+):
+    """
+    Dashboard statistics (status counts, confidence, processing time, gaps and a
+    time series) computed server-side by a single aggregation over upload_timestamp.
+    """
+    cache_key = (date_from, date_to, bucket)
+    cached = _analytics_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    match = {}
+    if date_from or date_to:
+        match["upload_timestamp"] = {k: v for k, v in (("$gte", date_from), ("$lte", date_to)) if v is not None}
+
+    try:
+        results = await get_collection("contracts").aggregate(build_analytics_pipeline(match, bucket)).to_list(length=1)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error computing analytics: {str(e)}")
+    facets = results[0] if results else {}
+    completed = (facets.get("completed") or [{}])[0]
+    by_status = {row["_id"] or "unknown": row["count"] for row in facets.get("by_status", [])}
+
+    response = AnalyticsResponse(
+        total_contracts=sum(by_status.values()),
+        by_status=by_status,
+        avg_confidence=completed.get("avg_confidence"),
+        min_confidence=completed.get("min_confidence"),
+        avg_processing_seconds=completed.get("avg_processing_seconds"),
+        max_processing_seconds=completed.get("max_processing_seconds"),
+        avg_gaps=completed.get("avg_gaps"),
+        gaps_by_field={row["_id"]: row["count"] for row in facets.get("gaps_by_field", [])},
+        bucket=bucket,
+        buckets=[
+            AnalyticsBucket(
+                period_start=row["_id"],
+                total=row["total"],
+                completed=row["completed"],
+                errors=row["errors"],
+                avg_confidence=row.get("avg_confidence"),
+                avg_processing_seconds=row.get("avg_processing_seconds"),
+            )
+            for row in facets.get("buckets", []) if row["_id"] is not None
+        ],
+        generated_at=datetime.utcnow(),
+    )
+    _analytics_cache.set(cache_key, response)
+    return response
+
+
+def _merge_counters(target: dict, source: dict):
+    for key, value in (source or {}).items():
+        target[key] = target.get(key, 0) + value
+
+
+def _daily_stats_from_doc(day: str, doc: dict) -> DailyStats:
+    return DailyStats(
+        day=day,
+        total=doc.get("total", 0),
+        deduplicated=doc.get("deduplicated", 0),
+        counts=doc.get("counts", {}),
+        gaps=doc.get("gaps", {}),
+        avg_confidence=doc["confidence_sum"] / doc["confidence_count"] if doc.get("confidence_count") else None,
+        avg_processing_seconds=doc["processing_seconds_sum"] / doc["processing_seconds_count"] if doc.get("processing_seconds_count") else None,
+        processing_time_hist=doc.get("processing_time_hist", {}),
+    )
+
+
+@router.get("/analytics/daily", response_model=DailyStatsResponse)
+async def get_daily_stats(
+    date_from: Optional[datetime] = Query(None, alias="dateFrom"),
+    date_to: Optional[datetime] = Query(None, alias="dateTo"),
+    days: int = Query(30, ge=1, le=366, description="Window ending at dateTo (or today) when dateFrom is not given"),
+):
+    """
+    Dashboard statistics from the per-day counters the worker maintains with $inc.
+    Reads one document per day in the range, independent of the number of contracts.
+    """
+    end = date_to or datetime.utcnow()
+    start = date_from or (end - timedelta(days=days - 1))
+    try:
+        docs = await get_collection(STATS_COLLECTION).find(
+            {"_id": {"$gte": stats_day(start), "$lte": stats_day(end)}}
+        ).sort("_id", 1).to_list(length=None)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error reading daily stats: {str(e)}")
+
+    totals = {}
+    for doc in docs:
+        for key in ("total", "deduplicated", "confidence_sum", "confidence_count", "processing_seconds_sum", "processing_seconds_count"):
+            totals[key] = totals.get(key, 0) + doc.get(key, 0)
+        for key in ("counts", "gaps", "processing_time_hist"):
+            _merge_counters(totals.setdefault(key, {}), doc.get(key))
+
+    return DailyStatsResponse(
+        days=[_daily_stats_from_doc(doc["_id"], doc) for doc in docs],
+        totals=_daily_stats_from_doc(f"{stats_day(start)}..{stats_day(end)}", totals),
+    )
@@ -1,93 +1,558 @@
 import os
+import json
+import time
+import uuid
+import tarfile
+import zipfile
 from pathlib import Path
-from fastapi import APIRouter, UploadFile, File, HTTPException, Query
-from starlette.responses import JSONResponse
-from typing import Optional
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Request
+import orjson
+from starlette.responses import Response
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-from pymongo import ASCENDING, DESCENDING
-from fastapi.responses import FileResponse
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+from celery import group
+from starlette.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse, ORJSONResponse
 
 from db.models import (
     Contract, StatusResponse, ContractDataResponse, 
-    PaginatedContractResponse, ContractSummary
+    PaginatedContractResponse, BatchProgressResponse,
+    BulkStatusRequest, BulkStatusResponse
 )
 from db.mongodb import get_collection
-from tasks.celery_worker import process_contract_task
-from core.config import settings
+from db.redis_store import get_cached_progress, get_cached_progress_many, get_redis, events_channel, TERMINAL_STATUSES
+from db.keyset import encode_cursor, decode_cursor, keyset_filter, InvalidCursorError
+from core.cache import TTLCache
+from tasks.celery_app import celery_app, PROCESS_CONTRACT_TASK, PROCESS_CONTRACT_BATCH_TASK
+from services.uploads import stream_upload_to_disk, extract_archive_pdfs, is_archive, StoredUpload, UploadTooLargeError
+from services.search_content import build_search_content, build_clause_text
+from services.result_cache import result_cache, make_etag
+from services.export import (
+    EXPORTABLE_FIELDS, EXPORT_MEDIA_TYPES, EXPORT_SORT_FIELD, EXPORT_SORT_DIRECTION,
+    ExportFormatUnavailableError, export_chunks, export_projection, require_format,
+)
+from services.field_summary import CRITICAL_FIELDS, required_fields_mask
+from services.daily_stats import STATS_COLLECTION, stats_day, build_daily_stats_update
+from core.config import settings, PIPELINE_VERSION
+
+# orjson for every response: faster on large nested extracted_data and 100-item list pages
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+# Result fields copied onto a new contract when identical bytes were already analyzed
+REUSABLE_RESULT_FIELDS = [
+    "extracted_data", "identified_gaps", "gaps_count", "processing_metrics",
+    "present_fields_mask", "min_confidence", "avg_confidence",
+]
+
+
+async def find_reusable_analyses(uploads: List[StoredUpload]) -> Dict[str, dict]:
+    """Returns completed contracts with the same content hash and pipeline version, keyed by hash."""
+    # Bytes that were new on disk cannot have been analyzed before
+    sha256s = [stored.sha256 for stored in uploads if stored.already_stored]
+    if not sha256s:
+        return {}
+    projection = {"_id": 0, "contract_id": 1, "file_sha256": 1, **{field: 1 for field in REUSABLE_RESULT_FIELDS}}
+    cursor = get_collection("contracts").find(
+        {"file_sha256": {"$in": list(set(sha256s))}, "pipeline_version": PIPELINE_VERSION, "processing_status": "completed"},
+        projection,
+    )
+    return {doc["file_sha256"]: doc async for doc in cursor}
 
-router = APIRouter()
+
+def build_contract_document(file_name: str, stored: StoredUpload, previous: Optional[dict] = None, batch_id: Optional[str] = None) -> dict:
+    """A new contract document; completed straight away when previous holds a reusable analysis."""
+    contract = Contract(file_name=file_name, file_path=str(stored.path), file_size=stored.size, file_sha256=stored.sha256, batch_id=batch_id)
+    if not previous:
+        return contract.dict(by_alias=True)
+    # Identical bytes already analyzed by this pipeline version: reuse the results
+    contract.processing_status = "completed"
+    contract.progress_percentage = 100
+    contract.progress_message = "Processing complete."
+    contract.pipeline_version = PIPELINE_VERSION
+    contract.deduplicated_from = previous["contract_id"]
+    document = contract.dict(by_alias=True)
+    document.update({field: previous.get(field) for field in REUSABLE_RESULT_FIELDS})
+    document["search_content"] = build_search_content(contract.file_name, previous.get("extracted_data"))
+    document["clause_text"] = build_clause_text(previous.get("extracted_data"))
+    return document
+
+
+def deduplicated_stats_update(document: dict) -> UpdateOne:
+    return UpdateOne(
+        {"_id": stats_day(document["upload_timestamp"])},
+        build_daily_stats_update("completed", document.get("identified_gaps"), document.get("avg_confidence"), deduplicated=True),
+        upsert=True,
+    )
 
 
 @router.post("/contracts/upload")
 async def upload_contract(file: UploadFile = File(...)):
     if file.content_type != "application/pdf":
         raise HTTPException(status_code=400, detail="Invalid file type. Only PDFs are accepted.")
-    uploads_dir = Path(settings.UPLOADS_DIR)
-    uploads_dir.mkdir(exist_ok=True)
-    contract = Contract(file_name=file.filename, file_path="")
-    file_path = uploads_dir / f"{contract.contract_id}_{file.filename}"
-    contract.file_path = str(file_path)
     try:
-        with open(file_path, "wb") as buffer:
-            buffer.write(await file.read())
+        stored = await stream_upload_to_disk(file, Path(settings.UPLOADS_DIR))
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Could not save file: {e}")
     contracts_collection = get_collection("contracts") 
-    await contracts_collection.insert_one(contract.dict(by_alias=True))
-    process_contract_task.delay(contract.contract_id, str(file_path))
-    return JSONResponse(status_code=202, content={"contract_id": contract.contract_id, "status": "processing", "message": "Contract uploaded successfully."})
+
+    previous = (await find_reusable_analyses([stored])).get(stored.sha256)
+    document = build_contract_document(file.filename, stored, previous)
+    await contracts_collection.insert_one(document)
+    if previous:
+        await get_collection(STATS_COLLECTION).bulk_write([deduplicated_stats_update(document)])
+        return ORJSONResponse(status_code=200, content={"contract_id": document["contract_id"], "status": "completed", "message": "Identical contract already analyzed; results reused."})
+
+    celery_app.send_task(PROCESS_CONTRACT_TASK, args=[document["contract_id"], document["file_path"], document["file_name"]])
+    return ORJSONResponse(status_code=202, content={"contract_id": document["contract_id"], "status": "processing", "message": "Contract uploaded successfully."})
+
+
+@router.post("/contracts/batch")
+async def upload_contract_batch(files: List[UploadFile] = File(..., description="PDFs and/or .zip/.tar/.tar.gz/.tgz archives of PDFs")):
+    """
+    Uploads many contracts in one request. Archives are unpacked on the fly;
+    contracts are inserted with one insert_many and their tasks (chunks of
+    WORKER_BATCH_CHUNK_SIZE contracts) enqueued as a single Celery group. Progress is available at /contracts/batches/{batch_id}.
+    """
+    uploads_dir = Path(settings.UPLOADS_DIR)
+    max_files = settings.BATCH_MAX_FILES
+    stored_files: List[Tuple[str, StoredUpload]] = []
+    rejected = []
+
+    for file in files:
+        if is_archive(file.filename):
+            try:
+                members = await run_in_threadpool(extract_archive_pdfs, file.file, file.filename, uploads_dir, max_files - len(stored_files))
+            except (zipfile.BadZipFile, tarfile.TarError) as e:
+                rejected.append({"file_name": file.filename, "reason": f"Unreadable archive: {e}"})
+                continue
+            for name, result in members:
+                if isinstance(result, StoredUpload):
+                    stored_files.append((name, result))
+                else:
+                    rejected.append({"file_name": name, "reason": result})
+            continue
+        if file.content_type != "application/pdf":
+            rejected.append({"file_name": file.filename, "reason": "Invalid file type. Only PDFs and archives are accepted."})
+            continue
+        if len(stored_files) >= max_files:
+            rejected.append({"file_name": file.filename, "reason": f"Batch limit of {max_files} files reached."})
+            continue
+        try:
+            stored_files.append((file.filename, await stream_upload_to_disk(file, uploads_dir)))
+        except UploadTooLargeError as e:
+            rejected.append({"file_name": file.filename, "reason": str(e)})
+
+    if not stored_files:
+        raise HTTPException(status_code=400, detail={"message": "No PDFs in the batch could be accepted.", "rejected": rejected})
+
+    batch_id = str(uuid.uuid4())
+    reusable = await find_reusable_analyses([stored for _, stored in stored_files])
+    documents = [build_contract_document(name, stored, reusable.get(stored.sha256), batch_id) for name, stored in stored_files]
+    reused = [doc for doc in documents if doc["processing_status"] == "completed"]
+    queued = [doc for doc in documents if doc["processing_status"] != "completed"]
+
+    await get_collection("contracts").insert_many(documents, ordered=False)
+    await get_collection("contract_batches").insert_one({
+        "batch_id": batch_id,
+        "created_at": datetime.utcnow(),
+        "total": len(documents),
+        "rejected": rejected,
+    })
+    if reused:
+        await get_collection(STATS_COLLECTION).bulk_write([deduplicated_stats_update(doc) for doc in reused], ordered=False)
+    if queued:
+        # Chunks of WORKER_BATCH_CHUNK_SIZE contracts per task, so the worker can batch their NER
+        chunk_size = max(settings.WORKER_BATCH_CHUNK_SIZE, 1)
+        chunks = [queued[i:i + chunk_size] for i in range(0, len(queued), chunk_size)]
+        group(
+            celery_app.signature(PROCESS_CONTRACT_BATCH_TASK, args=[[[doc["contract_id"], doc["file_path"], doc["file_name"]] for doc in chunk]])
+            if len(chunk) > 1 else
+            celery_app.signature(PROCESS_CONTRACT_TASK, args=[chunk[0]["contract_id"], chunk[0]["file_path"], chunk[0]["file_name"]])
+            for chunk in chunks
+        ).apply_async()
+
+    return ORJSONResponse(status_code=202, content={
+        "batch_id": batch_id,
+        "accepted": len(documents),
+        "queued": len(queued),
+        "reused": len(reused),
+        "rejected": rejected,
+        "contract_ids": [doc["contract_id"] for doc in documents],
+    })
+
+
+@router.get("/contracts/batches/{batch_id}", response_model=BatchProgressResponse)
+async def get_batch_progress(batch_id: str):
+    """Aggregated progress of a batch: contract counts per status and overall percentage."""
+    batch = await get_collection("contract_batches").find_one({"batch_id": batch_id}, {"_id": 0})
+    if not batch:
+        raise HTTPException(status_code=404, detail="Batch not found")
+
+    pipeline = [
+        {"$match": {"batch_id": batch_id}},
+        {"$group": {"_id": "$processing_status", "count": {"$sum": 1}, "progress": {"$sum": "$progress_percentage"}}},
+    ]
+    status_counts, progress_sum = {}, 0
+    async for row in get_collection("contracts").aggregate(pipeline):
+        status_counts[row["_id"]] = row["count"]
+        if row["_id"] != "processing":
+            progress_sum += row["progress"]
+
+    # Workers coalesce their MongoDB progress writes; in-flight contracts report live progress from Redis
+    if status_counts.get("processing"):
+        in_flight = {}
+        async for c in get_collection("contracts").find(
+            {"batch_id": batch_id, "processing_status": "processing"}, {"_id": 0, "contract_id": 1, "progress_percentage": 1}
+        ):
+            in_flight[c["contract_id"]] = c.get("progress_percentage", 0)
+        live_progress = await get_cached_progress_many(list(in_flight))
+        progress_sum += sum(live_progress.get(cid, {}).get("progress_percentage", stored) for cid, stored in in_flight.items())
+
+    total = batch["total"]
+    finished = sum(count for status, count in status_counts.items() if status in TERMINAL_STATUSES)
+    return BatchProgressResponse(
+        batch_id=batch_id,
+        created_at=batch["created_at"],
+        total=total,
+        status_counts=status_counts,
+        finished=finished,
+        progress_percentage=round(progress_sum / total) if total else 100,
+        rejected=batch.get("rejected", []),
+    )
+
+
+# Only the fields a status snapshot needs
+STATUS_PROJECTION = {"_id": 0, "contract_id": 1, "processing_status": 1, "progress_percentage": 1, "progress_message": 1, "error_message": 1}
+
+
+def status_from_document(contract: dict) -> dict:
+    return {
+        "contract_id": contract["contract_id"],
+        "status": contract.get("processing_status", "unknown"),
+        "progress_percentage": contract.get("progress_percentage", 0),
+        "progress_message": contract.get("progress_message", "Status not available."),
+        "error_message": contract.get("error_message"),
+    }
+
+
+async def get_status_snapshots(contract_ids: List[str]) -> Dict[str, dict]:
+    """Current status per contract: Redis first, then one $in query for the rest. Unknown ids are omitted."""
+    snapshots = {cid: {"contract_id": cid, **progress} for cid, progress in (await get_cached_progress_many(contract_ids)).items()}
+    missing = [cid for cid in contract_ids if cid not in snapshots]
+    if missing:
+        async for contract in get_collection("contracts").find({"contract_id": {"$in": missing}}, STATUS_PROJECTION):
+            snapshots[contract["contract_id"]] = status_from_document(contract)
+    return snapshots
+
+
+# BulkStatusEntry fields, in order
+BULK_STATUS_FIELDS = ["status", "progress_percentage", "progress_message", "error_message"]
+
+
+@router.post("/contracts/status", response_model=BulkStatusResponse, response_model_exclude_none=True)
+async def get_contract_statuses(request: BulkStatusRequest):
+    """
+    Status of many contracts in one call: in-flight progress from Redis, the
+    rest from a single $in query that reads only the status fields.
+    """
+    contract_ids = list(dict.fromkeys(cid for cid in request.contract_ids if cid))
+    if len(contract_ids) > settings.STATUS_BULK_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {settings.STATUS_BULK_MAX_IDS} contract IDs per request.")
+    snapshots = await get_status_snapshots(contract_ids)
+    return ORJSONResponse({
+        "statuses": {cid: {k: snapshot[k] for k in BULK_STATUS_FIELDS if snapshot.get(k) is not None} for cid, snapshot in snapshots.items()},
+        "not_found": [cid for cid in contract_ids if cid not in snapshots],
+    })
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.get("/contracts/events")
+async def stream_contract_status(request: Request, ids: str = Query(..., description="Comma-separated contract IDs to follow")):
+    """
+    Server-sent events stream of processing status for many contracts over one
+    connection, fed by the Redis pub/sub messages the worker publishes with each
+    progress write. Emits the current status of every contract first, then a
+    "status" event per update; closes once all of them reach a terminal state.
+    Clients without EventSource support can keep polling /contracts/{id}/status.
+    """
+    contract_ids = list(dict.fromkeys(_split_csv(ids)))
+    if not contract_ids:
+        raise HTTPException(status_code=400, detail="Provide at least one contract ID.")
+    if len(contract_ids) > settings.STATUS_STREAM_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {settings.STATUS_STREAM_MAX_IDS} contract IDs per stream.")
+    redis_client = get_redis()
+    if redis_client is None:
+        raise HTTPException(status_code=503, detail="Status streaming is unavailable.")
+
+    async def events():
+        pubsub = redis_client.pubsub()
+        try:
+            # Subscribe before reading snapshots so no update falls between the two
+            await pubsub.subscribe(*[events_channel(cid) for cid in contract_ids])
+            yield f"retry: {settings.STATUS_STREAM_RETRY_MS}\n\n"
+
+            snapshots = await get_status_snapshots(contract_ids)
+            pending = set()
+            for cid in contract_ids:
+                if cid not in snapshots:
+                    yield _sse("not_found", {"contract_id": cid})
+                    continue
+                yield _sse("status", snapshots[cid])
+                if snapshots[cid]["status"] not in TERMINAL_STATUSES:
+                    pending.add(cid)
+            if pending != set(contract_ids):
+                await pubsub.unsubscribe(*[events_channel(cid) for cid in contract_ids if cid not in pending])
+
+            deadline = time.monotonic() + settings.STATUS_STREAM_MAX_SECONDS
+            while pending and time.monotonic() < deadline:
+                if await request.is_disconnected():
+                    return
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=settings.STATUS_STREAM_HEARTBEAT_SECONDS)
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                update = json.loads(message["data"])
+                yield _sse("status", update)
+                if update.get("status") in TERMINAL_STATUSES:
+                    pending.discard(update["contract_id"])
+                    await pubsub.unsubscribe(events_channel(update["contract_id"]))
+            yield _sse("end", {"pending": sorted(pending)})
+        finally:
+            await pubsub.close()
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@router.get("/contracts/export")
+async def export_contracts(
+    format: str = Query("ndjson", regex="^(ndjson|csv|parquet)$"),
+    status: Optional[str] = Query("completed", description="Comma-separated processing statuses"),
+    date_from: Optional[datetime] = Query(None, alias="dateFrom"),
+    date_to: Optional[datetime] = Query(None, alias="dateTo"),
+    fields: Optional[str] = Query(None, description=f"Comma-separated fields to export; any of {', '.join(EXPORTABLE_FIELDS)}"),
+    cursor: Optional[str] = Query(None, description="resume_cursor of the last row received, to continue an interrupted export"),
+):
+    """
+    Streams matching contracts straight from a Mongo cursor as NDJSON, CSV or
+    Parquet. Memory stays constant regardless of result size: documents are
+    fetched, encoded and sent one batch at a time. CSV and Parquet flatten
+    extracted_data into one value/confidence column pair per critical field.
+    """
+    selected = _split_csv(fields) or EXPORTABLE_FIELDS
+    unknown = [f for f in selected if f not in EXPORTABLE_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown export fields: {', '.join(unknown)}")
+    try:
+        require_format(format)
+    except ExportFormatUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    query = build_contract_filter(status=status, date_from=date_from, date_to=date_to)
+    if cursor:
+        try:
+            query = {"$and": [query, keyset_filter(decode_cursor(cursor, EXPORT_SORT_FIELD, EXPORT_SORT_DIRECTION))]}
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    documents = (
+        get_collection("contracts")
+        .find(query, export_projection(selected))
+        .sort([(EXPORT_SORT_FIELD, EXPORT_SORT_DIRECTION), ("contract_id", EXPORT_SORT_DIRECTION)])
+        .batch_size(settings.EXPORT_BATCH_ROWS)
+    )
+    return StreamingResponse(
+        export_chunks(format, documents, selected),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="contracts-export.{format}"'},
+    )
 
 
 @router.get("/contracts/{contract_id}/status", response_model=StatusResponse)
 async def get_contract_status(contract_id: str):
-    contract = await get_collection("contracts").find_one({"contract_id": contract_id}) 
+    # In-flight progress lives in Redis; MongoDB is only updated on terminal states
+    progress = await get_cached_progress(contract_id)
+    if progress:
+        return StatusResponse(
+            contract_id=contract_id,
+            status=progress.get("status", "unknown"),
+            progress_percentage=progress.get("progress_percentage", 0),
+            progress_message=progress.get("progress_message", "Status not available."),
+            error_message=progress.get("error_message")
+        )
+    contract = await get_collection("contracts").find_one({"contract_id": contract_id}, STATUS_PROJECTION)
     if not contract:
         raise HTTPException(status_code=404, detail="Contract not found")
-    return StatusResponse(
-        contract_id=contract["contract_id"],
-        status=contract.get("processing_status", "unknown"),
-        progress_percentage=contract.get("progress_percentage", 0),
-        progress_message=contract.get("progress_message", "Status not available."),
-        error_message=contract.get("error_message")
-    )
+    return StatusResponse(**status_from_document(contract))
+
+
+# Fields get_contract_data reads; extracted_data can be narrowed further with ?fields=
+CONTRACT_DATA_PROJECTION = {
+    "_id": 0, "contract_id": 1, "file_name": 1, "processing_status": 1, "error_message": 1,
+    "extracted_data": 1, "identified_gaps": 1, "upload_timestamp": 1,
+}
+# Selectable parts of extracted_data: whole sections or section.field
+EXTRACTED_DATA_PATHS = {section for section, _ in CRITICAL_FIELDS.values()} | {f"{section}.{key}" for section, key in CRITICAL_FIELDS.values()}
+
+
+def contract_data_projection(fields: List[str]) -> dict:
+    unknown = [f for f in fields if f not in EXTRACTED_DATA_PATHS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}. Choose from: {', '.join(sorted(EXTRACTED_DATA_PATHS))}")
+    if not fields:
+        return CONTRACT_DATA_PROJECTION
+    projection = {k: v for k, v in CONTRACT_DATA_PROJECTION.items() if k != "extracted_data"}
+    # A section already covers its own fields; MongoDB rejects overlapping paths
+    for path in fields:
+        if path.split(".")[0] not in fields:
+            projection[f"extracted_data.{path}"] = 1
+    return projection
+
 
 @router.get("/contracts/{contract_id}", response_model=ContractDataResponse)
-async def get_contract_data(contract_id: str):
+async def get_contract_data(
+    contract_id: str,
+    request: Request,
+    fields: Optional[str] = Query(None, description="Comma-separated extracted_data sections or section.field paths, e.g. payment_structure"),
+):
     """
     Retrieves the fully parsed and structured data for a contract.
     This endpoint is only available for successfully completed contracts.
+
+    Completed responses are cached (services/result_cache.py) and carry a
+    strong ETag; a matching If-None-Match is answered with 304 Not Modified.
+    With fields=, only the requested parts of extracted_data are read from
+    MongoDB; those narrower responses bypass the cache.
     """
-    contract = await get_collection("contracts").find_one({"contract_id": contract_id})
+    selected = list(dict.fromkeys(_split_csv(fields)))
+    projection = contract_data_projection(selected)
+    cached = None if selected else await result_cache.get(contract_id)
+    if cached is None:
+        read_started = time.monotonic()
+        contract = await get_collection("contracts").find_one({"contract_id": contract_id}, projection)
 
-    if not contract:
-        raise HTTPException(status_code=404, detail="Contract not found")
+        if not contract:
+            raise HTTPException(status_code=404, detail="Contract not found")
 
-    status = contract.get("processing_status")
+        status = contract.get("processing_status")
 
-    if status == "processing":
-        raise HTTPException(
-            status_code=422,
-            detail="Contract is still being processed. Please check the status endpoint."
-        )
-    
-    if status == "error":
-        raise HTTPException(
-            status_code=409, 
-            detail=f"Processing failed for this contract. Error: {contract.get('error_message')}"
-        )
+        if status == "processing":
+            raise HTTPException(
+                status_code=422,
+                detail="Contract is still being processed. Please check the status endpoint."
+            )
+        
+        if status == "error":
+            raise HTTPException(
+                status_code=409, 
+                detail=f"Processing failed for this contract. Error: {contract.get('error_message')}"
+            )
 
-    if status != "completed":
-        raise HTTPException(status_code=500, detail=f"Contract is in an unknown state: {status}")
-
-    # If status is "completed", return the data
-    return ContractDataResponse(
-        contract_id=contract["contract_id"],
-        file_name=contract["file_name"],
-        processing_status=contract["processing_status"],
-        extracted_data=contract.get("extracted_data", {}),
-        identified_gaps=contract.get("identified_gaps", []),
-        upload_timestamp=contract["upload_timestamp"]
-    )
+        if status != "completed":
+            raise HTTPException(status_code=500, detail=f"Contract is in an unknown state: {status}")
+
+        # If status is "completed", return the data (shaped like ContractDataResponse; our own data, so not re-validated)
+        response = {
+            "contract_id": contract["contract_id"],
+            "file_name": contract["file_name"],
+            "processing_status": contract["processing_status"],
+            "extracted_data": contract.get("extracted_data") or {},
+            "identified_gaps": contract.get("identified_gaps") or [],
+            "upload_timestamp": contract["upload_timestamp"],
+        }
+        body = orjson.dumps(response)
+        cached = (make_etag(body), body) if selected else await result_cache.set(contract_id, body, read_started)
+
+    etag, body = cached
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag in [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# The frontend's status filter uses "failed" for what the pipeline calls "error"
+STATUS_ALIASES = {"failed": "error"}
+
+
+def _split_csv(value: Optional[str]) -> List[str]:
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
+def build_contract_filter(
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    confidence_min: Optional[float] = None,
+    confidence_max: Optional[float] = None,
+    file_size_min: Optional[int] = None,
+    file_size_max: Optional[int] = None,
+    required_fields: Optional[str] = None,
+) -> dict:
+    """
+    Translates list filters into a MongoDB query over indexed, precomputed fields
+    (see services/field_summary.py); nothing is evaluated client-side.
+    """
+    query = {}
+    if search and search.strip():
+        query["$text"] = {"$search": search.strip()}
+    statuses = [STATUS_ALIASES.get(s, s) for s in _split_csv(status)]
+    if statuses:
+        query["processing_status"] = {"$in": statuses}
+
+    def add_range(field: str, low, high):
+        bounds = {}
+        if low is not None:
+            bounds["$gte"] = low
+        if high is not None:
+            bounds["$lte"] = high
+        if bounds:
+            query[field] = bounds
+
+    add_range("upload_timestamp", date_from, date_to)
+    add_range("avg_confidence", confidence_min, confidence_max)
+    add_range("file_size", file_size_min, file_size_max)
+
+    fields = _split_csv(required_fields)
+    if fields:
+        try:
+            mask = required_fields_mask(fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        # A field the pipeline never extracts matches no contract
+        query["present_fields_mask"] = {"$bitsAllSet": mask} if mask is not None else {"$in": []}
+    return query
+
+
+# Fields a ContractSummary is built from
+LIST_PROJECTION = {
+    "_id": 0, "contract_id": 1, "file_name": 1, "processing_status": 1, "progress_percentage": 1,
+    "upload_timestamp": 1, "created_at": 1, "file_size": 1, "gaps_count": 1,
+}
+
+
+# Exact counts per filter, reused briefly so paging through a result set doesn't recount it every time
+_count_cache = TTLCache(ttl_seconds=settings.LIST_COUNT_CACHE_SECONDS)
+
+
+async def count_contracts(collection, query: dict, mode: str) -> Optional[int]:
+    if mode == "none":
+        return None
+    if mode == "estimated" and not query:
+        # Reads collection metadata instead of scanning
+        return await collection.estimated_document_count()
+    key = json.dumps(query, sort_keys=True, default=str)
+    cached = _count_cache.get(key)
+    if cached is None:
+        cached = await collection.count_documents(query)
+        _count_cache.set(key, cached)
+    return cached
 
 
 @router.get("/contracts", response_model=PaginatedContractResponse)
@@ -95,57 +560,107 @@ async def list_contracts(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     sort_by: str = Query("upload_timestamp", regex="^(upload_timestamp|file_name|processing_status)$"),
-    sort_order: str = Query("desc", regex="^(asc|desc)$")
+    sort_order: str = Query("desc", regex="^(asc|desc)$"),
+    search: Optional[str] = Query(None, max_length=200, description="Full-text search over file names, party names and clause text"),
+    status: Optional[str] = Query(None, description="Comma-separated processing statuses"),
+    date_from: Optional[datetime] = Query(None, alias="dateFrom"),
+    date_to: Optional[datetime] = Query(None, alias="dateTo"),
+    confidence_min: Optional[float] = Query(None, alias="confidenceMin", ge=0, le=1),
+    confidence_max: Optional[float] = Query(None, alias="confidenceMax", ge=0, le=1),
+    file_size_min: Optional[int] = Query(None, alias="fileSizeMin", ge=0),
+    file_size_max: Optional[int] = Query(None, alias="fileSizeMax", ge=0),
+    required_fields: Optional[str] = Query(None, alias="requiredFields", description="Comma-separated fields that must have been extracted"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's next_cursor; replaces page"),
+    count: str = Query("exact", regex="^(exact|estimated|none)$", description="How total_items is computed"),
 ):
-    """List all contracts with pagination and sorting."""
+    """
+    List contracts with sorting, indexed filters and an optional ranked text search.
+
+    Pages are addressed either by page/size (offset pagination, kept for
+    compatibility) or by cursor (keyset pagination on (sort field, contract_id),
+    which stays fast on deep pages). Counting can be exact (cached briefly),
+    estimated (collection metadata when unfiltered) or skipped entirely.
+    """
+    query = build_contract_filter(
+        search, status, date_from, date_to, confidence_min, confidence_max,
+        file_size_min, file_size_max, required_fields,
+    )
+    sort_direction = -1 if sort_order == "desc" else 1
+    keyset = None
+    if cursor:
+        if "$text" in query:
+            raise HTTPException(status_code=400, detail="Cursor pagination is not supported with search; use page instead.")
+        try:
+            keyset = decode_cursor(cursor, sort_by, sort_direction)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
     try:
         contracts_collection = get_collection("contracts")
         
-        # Build sort criteria
-        sort_direction = -1 if sort_order == "desc" else 1
-        sort_criteria = [(sort_by, sort_direction)]
-        
-        # Calculate skip value for pagination
-        skip = (page - 1) * size
+        # Build sort criteria; contract_id breaks ties so keyset positions are unique
+        sort_criteria = [(sort_by, sort_direction), ("contract_id", sort_direction)]
+
+        # Only the summary fields (plus the sort key for the next cursor); never extracted_data
+        projection = dict(LIST_PROJECTION, **{sort_by: 1})
+        # Text search goes through the text index; results are ranked by relevance first
+        if "$text" in query:
+            projection["score"] = {"$meta": "textScore"}
+            sort_criteria = [("score", {"$meta": "textScore"})] + sort_criteria
         
         # Get total count
-        total_count = await contracts_collection.count_documents({})
-        
-        # Get contracts with pagination and sorting
-        contracts_cursor = contracts_collection.find({}).sort(sort_criteria).skip(skip).limit(size)
+        total_count = await count_contracts(contracts_collection, query, count)
+
+        # Get contracts with pagination and sorting; one extra row tells us whether there is a next page
+        if keyset:
+            contracts_cursor = contracts_collection.find({"$and": [query, keyset_filter(keyset)]}, projection)
+        else:
+            contracts_cursor = contracts_collection.find(query, projection).skip((page - 1) * size)
+        contracts_cursor = contracts_cursor.sort(sort_criteria).limit(size + 1)
+        page_docs = await contracts_cursor.to_list(length=size + 1)
+        has_more = len(page_docs) > size
+        page_docs = page_docs[:size]
+
+        # Overlay live progress for contracts still being processed
+        in_flight = [c.get("contract_id") for c in page_docs if c.get("processing_status") == "processing"]
+        live_progress = await get_cached_progress_many(in_flight)
+
         contracts = []
-        
-        async for c in contracts_cursor:
+        for c in page_docs:
             # Handle missing upload_timestamp
             upload_timestamp = c.get("upload_timestamp")
             if upload_timestamp is None:
                 # Use created_at if available, otherwise use current time
                 upload_timestamp = c.get("created_at") or datetime.now()
             
-            contracts.append(ContractSummary(
-                contract_id=c.get("contract_id"),
-                file_name=c.get("file_name"),
-                processing_status=c.get("processing_status", "unknown"),
-                progress_percentage=c.get("progress_percentage", 0),
-                upload_timestamp=upload_timestamp,
-                file_size=c.get("file_size") or 0,
-                gaps_count=c.get("gaps_count") or 0,
-            ))
+            # Shaped like ContractSummary; built as a plain dict since it comes from our own collection
+            contracts.append({
+                "contract_id": c.get("contract_id"),
+                "file_name": c.get("file_name"),
+                "upload_timestamp": upload_timestamp,
+                "processing_status": c.get("processing_status", "unknown"),
+                "progress_percentage": live_progress.get(c.get("contract_id"), {}).get("progress_percentage", c.get("progress_percentage", 0)),
+                "gaps_count": c.get("gaps_count") or 0,
+                "file_size": c.get("file_size") or 0,
+            })
         
         # Calculate pagination info
-        total_pages = (total_count + size - 1) // size
-        has_next = page < total_pages
-        has_prev = page > 1
+        total_pages = (total_count + size - 1) // size if total_count is not None else None
+        next_cursor = None
+        if has_more and "$text" not in query:
+            next_cursor = encode_cursor(sort_by, sort_direction, page_docs[-1])
         
-        return PaginatedContractResponse(
-            total_items=total_count,
-            items=contracts,
-            page=page,
-            size=size,
-            total_pages=total_pages,
-            has_next=has_next,
-            has_prev=has_prev
-        )
+        # Returning the response directly skips response_model validation; the model still documents the shape
+        return ORJSONResponse({
+            "total_items": total_count,
+            "items": contracts,
+            "page": page,
+            "size": size,
+            "total_pages": total_pages,
+            "has_next": has_more,
+            "has_prev": bool(cursor) or page > 1,
+            "next_cursor": next_cursor,
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing contracts: {str(e)}")
@@ -158,7 +673,7 @@ async def download_contract(contract_id: str):
     contracts_collection = get_collection("contracts") 
     
     # 1. Find the contract document in the database
-    contract = await contracts_collection.find_one({"contract_id": contract_id})
+    contract = await contracts_collection.find_one({"contract_id": contract_id}, {"_id": 0, "file_path": 1, "file_name": 1})
 
     if not contract:
         raise HTTPException(status_code=404, detail="Contract not found")
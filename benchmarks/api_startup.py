@@ -0,0 +1,64 @@
+"""
+Measures how long the API takes to import and build its app, and verifies that
+booting it does not import any ML framework.
+
+    python -m benchmarks.api_startup [--runs 5]
+
+Each run uses a fresh interpreter so import caches do not skew the timing.
+Exits non-zero if torch, spaCy or sentence-transformers end up in sys.modules.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FORBIDDEN_MODULES = ["torch", "spacy", "sentence_transformers", "transformers", "fitz"]
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import main
+main.app.openapi()
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "loaded": [m for m in %r if m in sys.modules],
+}))
+""" % (FORBIDDEN_MODULES,)
+
+
+def run_once() -> dict:
+    env = dict(os.environ)
+    # Settings are required at import time; no connection is made while booting
+    env.setdefault("MONGO_URI", "mongodb://localhost:27017")
+    env.setdefault("MONGO_DB_NAME", "contract_intelligence")
+    env.setdefault("REDIS_URI", "redis://localhost:6379")
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = [run_once() for _ in range(args.runs)]
+    times = [r["seconds"] for r in results]
+    loaded = sorted({m for r in results for m in r["loaded"]})
+
+    print(f"API boot over {args.runs} runs: median {statistics.median(times) * 1000:.0f} ms, "
+          f"min {min(times) * 1000:.0f} ms, max {max(times) * 1000:.0f} ms")
+    print(f"Peak RSS: {max(r['max_rss_mb'] for r in results):.0f} MB")
+    if loaded:
+        print(f"FAIL: API boot imported {', '.join(loaded)}")
+        sys.exit(1)
+    print(f"OK: none of {', '.join(FORBIDDEN_MODULES)} imported")
+
+
+if __name__ == "__main__":
+    main()
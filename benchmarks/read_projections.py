@@ -0,0 +1,112 @@
+"""
+Bytes on the wire and read latency of the contract read paths, with and without
+the projections the API uses, on large synthetic documents.
+
+    python -m benchmarks.read_projections --docs 500 --snippet-kb 16 --repeat 200
+
+Needs a reachable MongoDB (MONGO_URI). Documents are written to a scratch
+collection, which is dropped afterwards.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("MONGO_DB_NAME", "contract_intelligence")
+os.environ.setdefault("REDIS_URI", "redis://localhost:6379")
+
+from bson.raw_bson import RawBSONDocument
+from pymongo import MongoClient, DESCENDING
+
+from api.contracts import STATUS_PROJECTION, LIST_PROJECTION, contract_data_projection
+from core.config import settings
+from services.field_summary import CRITICAL_FIELDS
+
+COLLECTION = "benchmark_read_projections"
+
+
+def make_document(snippet_bytes: int) -> dict:
+    def field():
+        return {"value": "x" * 40, "confidence_score": random.random(), "source_snippet": "s" * snippet_bytes, "source_page": 1}
+    extracted = {}
+    for section, key in CRITICAL_FIELDS.values():
+        extracted.setdefault(section, {})[key] = field()
+    return {
+        "contract_id": str(uuid.uuid4()),
+        "file_name": "contract.pdf",
+        "file_path": "uploads/contract.pdf",
+        "upload_timestamp": datetime.utcnow() - timedelta(seconds=random.randint(0, 10**6)),
+        "processing_status": "completed",
+        "progress_percentage": 100,
+        "progress_message": "Processing complete.",
+        "file_size": 250_000,
+        "gaps_count": 0,
+        "identified_gaps": [],
+        "extracted_data": extracted,
+        "search_content": "contract " * 20,
+        "clause_text": "c" * snippet_bytes * 3,
+        "processing_metrics": {"semantic_embeddings": 120, "semantic_encode_seconds": 0.4},
+    }
+
+
+def measure(run, repeat: int) -> dict:
+    sizes, timings = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        docs = run()
+        timings.append(time.perf_counter() - start)
+        sizes.append(sum(len(d.raw) for d in docs))
+    return {"bytes": statistics.mean(sizes), "ms": statistics.median(timings) * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--snippet-kb", type=float, default=16, help="size of each extracted field's source_snippet")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    client = MongoClient(settings.MONGO_URI, document_class=RawBSONDocument)
+    collection = client[settings.MONGO_DB_NAME][COLLECTION]
+    collection.drop()
+    try:
+        docs = [make_document(int(args.snippet_kb * 1024)) for _ in range(args.docs)]
+        collection.insert_many(docs)
+        collection.create_index("contract_id")
+        collection.create_index([("upload_timestamp", DESCENDING), ("contract_id", DESCENDING)])
+        ids = [d["contract_id"] for d in docs]
+
+        def one(projection):
+            return lambda: [collection.find_one({"contract_id": random.choice(ids)}, projection)]
+
+        def page(projection):
+            sort = [("upload_timestamp", DESCENDING), ("contract_id", DESCENDING)]
+            return lambda: list(collection.find({}, projection).sort(sort).limit(args.page_size))
+
+        cases = [
+            ("status", one(None), one(STATUS_PROJECTION)),
+            ("contract data", one(None), one(contract_data_projection([]))),
+            ("data ?fields=payment_structure", one(None), one(contract_data_projection(["payment_structure"]))),
+            (f"list page of {args.page_size}", page(None), page(LIST_PROJECTION)),
+        ]
+        print(f"{args.docs} documents, {args.snippet_kb:g} KB per snippet, median of {args.repeat} reads")
+        print(f"{'read':<32} {'full bytes':>11} {'proj bytes':>11} {'full ms':>8} {'proj ms':>8}")
+        for name, full, projected in cases:
+            f, p = measure(full, args.repeat), measure(projected, args.repeat)
+            print(f"{name:<32} {f['bytes']:>11.0f} {p['bytes']:>11.0f} {f['ms']:>8.2f} {p['ms']:>8.2f}")
+    finally:
+        collection.drop()
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
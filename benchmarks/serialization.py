@@ -0,0 +1,107 @@
+"""
+Response serialization micro-benchmarks on realistic payloads: FastAPI's default
+path (validate into the response model, jsonable_encoder, json.dumps) versus
+the contract router's path (plain dicts rendered by orjson).
+
+    python -m benchmarks.serialization --number 200 --snippet-kb 2
+
+Needs only the API's dependencies; no database is touched.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("MONGO_DB_NAME", "contract_intelligence")
+os.environ.setdefault("REDIS_URI", "redis://localhost:6379")
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from db.models import ContractDataResponse, ContractSummary, PaginatedContractResponse
+from services.field_summary import CRITICAL_FIELDS
+
+
+def contract_data(snippet_bytes: int) -> dict:
+    extracted = {}
+    for section, key in CRITICAL_FIELDS.values():
+        extracted.setdefault(section, {})[key] = {
+            "value": {"classification": "Conditional Renewal", "text": "r" * 200} if key == "renewal_terms" else "Acme Corporation",
+            "confidence_score": random.random(),
+            "source_snippet": "s" * snippet_bytes,
+            "source_page": random.randint(1, 40),
+        }
+    return {
+        "contract_id": str(uuid.uuid4()),
+        "file_name": "master-services-agreement.pdf",
+        "processing_status": "completed",
+        "extracted_data": extracted,
+        "identified_gaps": ["billing_cycle"],
+        "upload_timestamp": datetime.utcnow(),
+    }
+
+
+def summary() -> dict:
+    return {
+        "contract_id": str(uuid.uuid4()),
+        "file_name": "master-services-agreement.pdf",
+        "upload_timestamp": datetime.utcnow() - timedelta(minutes=random.randint(0, 10**5)),
+        "processing_status": "completed",
+        "progress_percentage": 100,
+        "gaps_count": random.randint(0, 6),
+        "file_size": random.randint(10**4, 10**7),
+    }
+
+
+def list_page(size: int) -> dict:
+    return {
+        "total_items": 12345, "items": [summary() for _ in range(size)], "page": 1, "size": size,
+        "total_pages": 124, "has_next": True, "has_prev": False, "next_cursor": "eyJmIjoidXBsb2FkX3RpbWVzdGFtcCJ9",
+    }
+
+
+def default_path(model, payload: dict) -> bytes:
+    return json.dumps(jsonable_encoder(model(**payload)), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def list_default_path(payload: dict) -> bytes:
+    validated = PaginatedContractResponse(**{**payload, "items": [ContractSummary(**item) for item in payload["items"]]})
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=200, help="calls per measurement")
+    parser.add_argument("--snippet-kb", type=float, default=2, help="size of each extracted field's source_snippet")
+    args = parser.parse_args()
+
+    detail = contract_data(int(args.snippet_kb * 1024))
+    page = list_page(100)
+    export_batch = [contract_data(int(args.snippet_kb * 1024)) for _ in range(100)]
+
+    cases = [
+        ("contract data", lambda: default_path(ContractDataResponse, detail), lambda: orjson.dumps(detail)),
+        ("list page of 100", lambda: list_default_path(page), lambda: orjson.dumps(page)),
+        ("export batch of 100 (NDJSON)",
+         lambda: b"\n".join(default_path(ContractDataResponse, d) for d in export_batch),
+         lambda: b"".join(orjson.dumps(d, option=orjson.OPT_APPEND_NEWLINE) for d in export_batch)),
+    ]
+    print(f"median of 5 runs x {args.number} calls, {args.snippet_kb:g} KB per snippet")
+    print(f"{'payload':<30} {'bytes':>9} {'default us':>11} {'orjson us':>10} {'speedup':>8}")
+    for name, default, fast in cases:
+        size = len(fast())
+        t_default = sorted(timeit.repeat(default, number=args.number, repeat=5))[2] / args.number * 1e6
+        t_fast = sorted(timeit.repeat(fast, number=args.number, repeat=5))[2] / args.number * 1e6
+        print(f"{name:<30} {size:>9} {t_default:>11.1f} {t_fast:>10.1f} {t_default / t_fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
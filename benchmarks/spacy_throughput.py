@@ -0,0 +1,71 @@
+"""
+Party NER throughput (documents/second) versus spaCy configuration: full versus
+trimmed pipeline (SPACY_EXCLUDE), first-50,000-characters versus preamble
+window, and one nlp() call per document versus nlp.pipe at several batch sizes
+and process counts.
+
+    python -m benchmarks.spacy_throughput path/to/pdfs --batch-sizes 1,8,32 --n-process 1,2
+
+Needs spaCy and the model installed. PDFs are parsed once up front; only NER is timed.
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+# Settings are required at import time; no connection is made by this benchmark
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("MONGO_DB_NAME", "contract_intelligence")
+os.environ.setdefault("REDIS_URI", "redis://localhost:6379")
+
+
+def run(nlp, texts, batch_size: int, n_process: int) -> float:
+    start = time.perf_counter()
+    if batch_size == 1 and n_process == 1:
+        for text in texts:
+            nlp(text)
+    else:
+        for _ in nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+            pass
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf_dir", type=Path)
+    parser.add_argument("--batch-sizes", default="1,8,32", help="comma-separated; 1 = one nlp() call per document")
+    parser.add_argument("--n-process", default="1", help="comma-separated nlp.pipe process counts")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    from services.contract_processor import ContractProcessor
+    from core.config import settings
+    processors = [ContractProcessor(str(p)) for p in sorted(args.pdf_dir.glob("*.pdf"))] * args.repeat
+    if not processors:
+        sys.exit(f"No PDFs found in {args.pdf_dir}")
+    windows = {
+        "first 50k chars": [p.full_text[:settings.NER_FALLBACK_CHARS] for p in processors],
+        "preamble": [p.preamble_text() for p in processors],
+    }
+    for name, texts in windows.items():
+        print(f"{name}: {sum(map(len, texts)) / len(texts):.0f} chars/document on average")
+
+    print(f"{len(processors)} documents")
+    print(f"{'pipeline':<9} {'window':<16} {'batch':>6} {'procs':>6} {'docs/s':>9}")
+    from services.model_registry import load_spacy_pipeline, spacy_exclude
+    for trimmed in (False, True):
+        nlp = load_spacy_pipeline(spacy_exclude() if trimmed else [])
+        label = "trimmed" if trimmed else "full"
+        for window, texts in windows.items():
+            nlp(texts[0])  # warm up
+            for batch_size in (int(b) for b in args.batch_sizes.split(",")):
+                for n_process in (int(n) for n in args.n_process.split(",")):
+                    rate = run(nlp, texts, batch_size, n_process)
+                    print(f"{label:<9} {window:<16} {batch_size:>6} {n_process:>6} {rate:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
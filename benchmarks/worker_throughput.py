@@ -0,0 +1,82 @@
+"""
+Contracts/minute versus pool concurrency, using the same layout as the prefork
+worker: models are loaded once in the parent, children are forked from it, cap
+their torch threads and warm up before the clock starts.
+
+    python -m benchmarks.worker_throughput path/to/pdfs --concurrency 1,2,4,8 --threads-per-child 1
+
+Needs the worker's dependencies and models installed. Every PDF in the directory
+is processed once per concurrency level (use --repeat to make the run longer).
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+# Settings are required at import time; no connection is made by this benchmark
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("MONGO_DB_NAME", "contract_intelligence")
+os.environ.setdefault("REDIS_URI", "redis://localhost:6379")
+
+
+def _init_child():
+    from tasks.worker_lifecycle import cap_torch_threads
+    from services.contract_processor import warm_up
+    cap_torch_threads()
+    warm_up()
+
+
+def _analyze(file_path: str) -> float:
+    from services.contract_processor import analyze_contract_advanced
+    start = time.perf_counter()
+    analyze_contract_advanced(file_path)
+    return time.perf_counter() - start
+
+
+def run_level(files, concurrency: int) -> dict:
+    ctx = multiprocessing.get_context("fork")
+    with ctx.Pool(concurrency, initializer=_init_child) as pool:
+        # Make sure every child has finished warming up before timing
+        pool.map(time.sleep, [0.1] * concurrency)
+        start = time.perf_counter()
+        durations = pool.map(_analyze, files, chunksize=1)
+        elapsed = time.perf_counter() - start
+    return {
+        "concurrency": concurrency,
+        "contracts": len(files),
+        "seconds": elapsed,
+        "per_minute": len(files) / elapsed * 60,
+        "mean_latency": sum(durations) / len(durations),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf_dir", type=Path)
+    parser.add_argument("--concurrency", default="1,2,4,8", help="comma-separated pool sizes")
+    parser.add_argument("--threads-per-child", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    files = sorted(str(p) for p in args.pdf_dir.glob("*.pdf")) * args.repeat
+    if not files:
+        sys.exit(f"No PDFs found in {args.pdf_dir}")
+
+    os.environ["TORCH_THREADS_PER_CHILD"] = str(args.threads_per_child)
+    from tasks.worker_lifecycle import cap_torch_threads, preload_models_for_fork
+    cap_torch_threads()
+    preload_models_for_fork()
+
+    print(f"{len(files)} contracts, {args.threads_per_child} torch thread(s) per child, {os.cpu_count()} CPUs")
+    print(f"{'concurrency':>11} {'seconds':>9} {'contracts/min':>14} {'mean latency':>13}")
+    for level in (int(c) for c in args.concurrency.split(",")):
+        r = run_level(files, level)
+        print(f"{r['concurrency']:>11} {r['seconds']:>9.1f} {r['per_minute']:>14.1f} {r['mean_latency']:>12.2f}s")
+
+
+if __name__ == "__main__":
+    main()
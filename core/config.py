@@ -5,6 +5,67 @@ class Settings(BaseSettings):
     MONGO_DB_NAME: str
     REDIS_URI: str
     UPLOADS_DIR: str = "uploads"
+    ENSURE_INDEXES_ON_STARTUP: bool = True           # create missing indexes declared in db/indexes.py at API startup (rebuilds: python -m db.indexes ensure)
+    MAX_UPLOAD_BYTES: int = 50 * 1024 * 1024          # uploads larger than this are rejected with 413
+    UPLOAD_CHUNK_BYTES: int = 1024 * 1024             # read/write size while streaming uploads to disk
+    BATCH_MAX_FILES: int = 1000                       # PDFs accepted per batch upload, counting archive members
+    MAX_BATCH_UPLOAD_BYTES: int = 2 * 1024 ** 3       # whole /contracts/batch request body; larger is rejected with 413
+    EXPORT_BATCH_ROWS: int = 1000                     # contracts per export chunk (and per Parquet row group)
+
+    # NLP pipeline
+    SPACY_MODEL_NAME: str = "en_core_web_sm"
+    SPACY_EXCLUDE: str = "tagger,parser,senter,attribute_ruler,lemmatizer"  # components not loaded; only ner is used
+    SPACY_PIPE_BATCH_SIZE: int = 16      # preambles per nlp.pipe batch when a task analyzes several contracts
+    SPACY_N_PROCESS: int = 1             # nlp.pipe processes; >1 needs a non-daemonic pool (e.g. --pool=solo/threads)
+    SEMANTIC_MODEL_NAME: str = "all-MiniLM-L6-v2"
+    EMBEDDINGS_CACHE_DIR: str = ".embedding_cache"  # on-disk prototype embedding cache
+    SEMANTIC_BATCH_SIZE: int = 32        # sentences per SentenceTransformer forward pass
+    NER_PREAMBLE_MAX_PAGES: int = 2      # party NER looks for the preamble within these first pages
+    NER_PREAMBLE_MAX_CHARS: int = 6000   # upper bound on the preamble span passed to NER
+    NER_FALLBACK_CHARS: int = 50000      # wider window when the preamble yields fewer than two organizations
+
+    # Worker lifecycle
+    WORKER_WARM_UP: bool = True                      # load models and run a warm-up inference at boot
+    WORKER_READY_FILE: str = "/tmp/contract_worker_ready"  # touched once a worker process is warm; "" to disable
+    WORKER_READY_KEY_PREFIX: str = "worker:ready"    # Redis key <prefix>:<hostname>:<pid>; "" to disable
+    WORKER_READY_TTL_SECONDS: int = 60               # the Redis key expires unless a live process keeps refreshing it
+    WORKER_PROC_ALIVE_TIMEOUT: float = 300.0         # seconds a pool child may spend in init (model load) before Celery kills it
+
+    # Worker pool (prefork)
+    WORKER_CONCURRENCY: int = 0                      # pool processes; 0 = one per CPU
+    WORKER_MAX_TASKS_PER_CHILD: int = 200            # recycle a child after this many contracts; 0 = never
+    WORKER_BATCH_CHUNK_SIZE: int = 8                 # contracts per task for batch uploads (NER batched via nlp.pipe); 1 = one task each
+    WORKER_PRELOAD_MODELS: bool = True               # load models in the parent so children share them copy-on-write
+    TORCH_THREADS_PER_CHILD: int = 1                 # intra-op threads per pool child; 0 = torch default
+
+    # Worker MongoDB client (one pooled client per worker process)
+    WORKER_MONGO_MAX_POOL_SIZE: int = 4
+    WORKER_MONGO_MIN_POOL_SIZE: int = 1
+    WORKER_MONGO_CONNECT_TIMEOUT_MS: int = 10000
+    WORKER_MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 10000
+    WORKER_MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 0      # max wait for a pooled connection; 0 = unbounded
+
+    # Progress reporting (Redis fast store; MongoDB is written on terminal states only)
+    PROGRESS_MIN_INTERVAL_SECONDS: float = 1.0       # coalesce progress updates closer together than this
+    PROGRESS_TTL_SECONDS: int = 86400                # how long progress snapshots stay in Redis
+
+    # Streaming status (server-sent events)
+    STATUS_BULK_MAX_IDS: int = 1000                  # contracts per POST /contracts/status lookup
+    STATUS_STREAM_MAX_IDS: int = 500                 # contracts one connection may follow
+    STATUS_STREAM_HEARTBEAT_SECONDS: float = 15.0    # keep-alive comment interval when nothing changes
+    STATUS_STREAM_MAX_SECONDS: float = 3600.0        # streams end after this long; clients reconnect
+    STATUS_STREAM_RETRY_MS: int = 3000               # reconnect delay advertised to EventSource clients
+
+    # Contract list
+    LIST_COUNT_CACHE_SECONDS: float = 10.0           # how long exact list counts are reused per filter
+
+    # Analytics
+    ANALYTICS_CACHE_SECONDS: float = 30.0            # dashboard aggregation results are reused for this long
+
+    # Contract result cache (completed GET /contracts/{id} responses)
+    RESULT_CACHE_MAX_ENTRIES: int = 512              # completed contract responses kept in-process per API worker; 0 = off
+    RESULT_CACHE_REDIS: bool = True                  # also share cached responses across API processes through Redis
+    RESULT_CACHE_REDIS_TTL_SECONDS: int = 24 * 3600  # upper bound on a Redis entry's life
 
     # CORS
     CORS_ALLOW_ORIGINS: str = "*"        # comma-separated list or "*"
@@ -15,4 +76,10 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
+
+# Identifies the extraction logic and models that produced a result. Uploads whose
+# bytes match an already-analyzed contract with the same version reuse its results,
+# so bump EXTRACTION_LOGIC_VERSION whenever extraction behaviour changes.
+EXTRACTION_LOGIC_VERSION = "1"
+PIPELINE_VERSION = f"{EXTRACTION_LOGIC_VERSION}:{settings.SPACY_MODEL_NAME}:{settings.SEMANTIC_MODEL_NAME}"
\ No newline at end of file
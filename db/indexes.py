@@ -0,0 +1,170 @@
+"""
+Declarative index definitions for every collection. Missing ones are created at
+API startup; changed ones are rebuilt only through the CLI.
+
+    python -m db.indexes report   # missing, mismatched, undeclared and unused indexes
+    python -m db.indexes ensure   # create missing indexes and rebuild changed ones
+
+"Unused" comes from $indexStats: indexes with no accesses since the server
+(or the index) last started. Run the report against a primary that has seen
+representative traffic.
+"""
+import argparse
+from typing import Dict, List
+from pymongo import IndexModel, ASCENDING, DESCENDING, TEXT
+from pymongo.errors import OperationFailure
+
+from core.config import settings
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    "contracts": [
+        # Every endpoint looks contracts up by id
+        IndexModel([("contract_id", ASCENDING)], name="contract_id_unique", unique=True),
+        # List sorts, each ending in contract_id so keyset pagination is an index range scan
+        IndexModel([("upload_timestamp", DESCENDING), ("contract_id", DESCENDING)], name="uploaded_keyset"),
+        IndexModel([("file_name", ASCENDING), ("contract_id", ASCENDING)], name="file_name_keyset"),
+        IndexModel([("processing_status", ASCENDING), ("contract_id", ASCENDING)], name="status_keyset"),
+        # List filters: status, upload date range, confidence and file size, each paired with the default sort
+        IndexModel([("processing_status", ASCENDING), ("upload_timestamp", DESCENDING), ("contract_id", DESCENDING)], name="status_uploaded"),
+        IndexModel([("avg_confidence", ASCENDING), ("upload_timestamp", DESCENDING), ("contract_id", DESCENDING)], name="confidence_uploaded"),
+        IndexModel([("file_size", ASCENDING), ("upload_timestamp", DESCENDING), ("contract_id", DESCENDING)], name="size_uploaded"),
+        IndexModel([("present_fields_mask", ASCENDING), ("upload_timestamp", DESCENDING), ("contract_id", DESCENDING)], name="fields_uploaded"),
+        # Dedup lookup: completed analyses by content hash and pipeline version
+        IndexModel([("file_sha256", ASCENDING), ("pipeline_version", ASCENDING), ("processing_status", ASCENDING)], name="dedup_lookup"),
+        # Batch progress: contracts of one batch grouped by status. Single uploads store
+        # batch_id: null, so only string batch ids are indexed (sparse would keep the nulls)
+        IndexModel(
+            [("batch_id", ASCENDING), ("processing_status", ASCENDING)],
+            name="batch_status",
+            partialFilterExpression={"batch_id": {"$type": "string"}},
+        ),
+        # Full-text search over file name / party names (search_content) and clause text
+        IndexModel(
+            [("search_content", TEXT), ("clause_text", TEXT)],
+            weights={"search_content": 10, "clause_text": 2},
+            default_language="english",
+            name="contract_text_search",
+        ),
+    ],
+    "contract_batches": [
+        IndexModel([("batch_id", ASCENDING)], name="batch_id_unique", unique=True),
+    ],
+}
+
+
+def _options(spec: dict):
+    return bool(spec.get("unique")), bool(spec.get("sparse")), spec.get("partialFilterExpression")
+
+
+def _declared_spec(model: IndexModel):
+    doc = model.document
+    text_fields = [field for field, kind in doc["key"].items() if kind == TEXT]
+    if text_fields:
+        return ("text", tuple(sorted(text_fields))), _options(doc)
+    return tuple(doc["key"].items()), _options(doc)
+
+
+def _existing_spec(info: dict):
+    # Text indexes are stored as _fts/_ftsx keys; compare them by their weighted fields
+    if "weights" in info:
+        return ("text", tuple(sorted(info["weights"]))), _options(info)
+    keys = tuple((field, int(kind) if isinstance(kind, (int, float)) else kind) for field, kind in info["key"])
+    return keys, _options(info)
+
+
+def _plan(models: List[IndexModel], existing: dict):
+    """Splits declared indexes into (to_create, to_replace) against index_information()."""
+    to_create, to_replace = [], []
+    for model in models:
+        name = model.document["name"]
+        if name not in existing:
+            to_create.append(model)
+        elif _declared_spec(model) != _existing_spec(existing[name]):
+            to_replace.append(model)
+    return to_create, to_replace
+
+
+async def ensure_indexes(database, rebuild: bool = False):
+    """
+    Creates missing declared indexes. Indexes whose definition changed are only
+    reported, unless rebuild is set: dropping and recreating them is left to
+    `python -m db.indexes ensure`, so concurrently starting API processes never
+    race each other's drop/create.
+    """
+    for collection_name, models in INDEXES.items():
+        collection = database[collection_name]
+        existing = await collection.index_information()
+        to_create, to_replace = _plan(models, existing)
+        if not rebuild:
+            for model in to_replace:
+                print(f"Index {collection_name}.{model.document['name']} differs from its declaration; run `python -m db.indexes ensure` to rebuild it.")
+            to_replace = []
+        for model in to_replace:
+            print(f"Index {collection_name}.{model.document['name']} changed; rebuilding.")
+            await collection.drop_index(model.document["name"])
+        for model in to_replace + to_create:
+            try:
+                await collection.create_indexes([model])
+            except OperationFailure as e:
+                # e.g. duplicate contract_ids from before the unique index existed
+                print(f"Could not create index {collection_name}.{model.document['name']}: {e}")
+        if to_create or to_replace:
+            print(f"Indexes for '{collection_name}': created {len(to_create)}, rebuilt {len(to_replace)}.")
+
+
+def report(database) -> bool:
+    """Prints index health for every declared collection; returns True if nothing is missing."""
+    healthy = True
+    for collection_name, models in INDEXES.items():
+        collection = database[collection_name]
+        existing = collection.index_information()
+        declared = {model.document["name"] for model in models}
+        to_create, to_replace = _plan(models, existing)
+        usage = {s["name"]: s for s in collection.aggregate([{"$indexStats": {}}])}
+
+        print(f"[{collection_name}]")
+        for model in to_create:
+            print(f"  MISSING     {model.document['name']}")
+        for model in to_replace:
+            print(f"  MISMATCHED  {model.document['name']} (definition differs from the declared one)")
+        for name in sorted(set(existing) - declared - {"_id_"}):
+            print(f"  UNDECLARED  {name}")
+        for name in sorted(n for n in existing if n != "_id_"):
+            stats = usage.get(name)
+            if stats and stats["accesses"]["ops"] == 0:
+                print(f"  UNUSED      {name} (0 ops since {stats['accesses']['since']:%Y-%m-%d %H:%M})")
+        if not (to_create or to_replace):
+            print(f"  all {len(models)} declared indexes present")
+        healthy = healthy and not (to_create or to_replace)
+    return healthy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["report", "ensure"])
+    args = parser.parse_args()
+
+    if args.command == "ensure":
+        import asyncio
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        async def _ensure():
+            client = AsyncIOMotorClient(settings.MONGO_URI)
+            try:
+                await ensure_indexes(client[settings.MONGO_DB_NAME], rebuild=True)
+            finally:
+                client.close()
+        asyncio.run(_ensure())
+        return
+
+    from pymongo import MongoClient
+    client = MongoClient(settings.MONGO_URI)
+    try:
+        healthy = report(client[settings.MONGO_DB_NAME])
+    finally:
+        client.close()
+    raise SystemExit(0 if healthy else 1)
+
+
+if __name__ == "__main__":
+    main()
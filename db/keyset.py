@@ -0,0 +1,63 @@
+import json
+import base64
+from datetime import datetime
+from typing import Any, Optional
+
+# Opaque cursors for keyset pagination over (sort_field, contract_id). The cursor
+# carries the sort key of the last item returned, so the next page is an index
+# range scan from that point instead of a skip over everything before it.
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$date": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    # Cursors come from clients: only plain scalars or a {"$date": iso} wrapper may reach a query
+    if isinstance(value, dict):
+        if set(value) != {"$date"} or not isinstance(value["$date"], str):
+            raise InvalidCursorError("Malformed cursor.")
+        return datetime.fromisoformat(value["$date"])
+    if value is not None and (isinstance(value, bool) or not isinstance(value, (str, int, float))):
+        raise InvalidCursorError("Malformed cursor.")
+    return value
+
+
+def encode_cursor(sort_field: str, direction: int, document: dict) -> str:
+    payload = {"f": sort_field, "d": direction, "v": _encode_value(document.get(sort_field)), "id": document.get("contract_id")}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, sort_field: Optional[str] = None, direction: Optional[int] = None) -> dict:
+    """Decodes a cursor, checking it was issued for the same sort; raises InvalidCursorError otherwise."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        cursor = {"sort_field": payload["f"], "direction": payload["d"], "value": _decode_value(payload["v"]), "contract_id": payload["id"]}
+    except InvalidCursorError:
+        raise
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Malformed cursor.") from e
+    if not isinstance(cursor["sort_field"], str) or not isinstance(cursor["contract_id"], str) \
+            or isinstance(cursor["direction"], bool) or cursor["direction"] not in (1, -1):
+        raise InvalidCursorError("Malformed cursor.")
+    if (sort_field is not None and cursor["sort_field"] != sort_field) or (direction is not None and cursor["direction"] != direction):
+        raise InvalidCursorError("Cursor was issued for a different sort order.")
+    return cursor
+
+
+def keyset_filter(cursor: dict) -> dict:
+    """Matches documents strictly after the cursor position in (sort_field, contract_id) order."""
+    op = "$lt" if cursor["direction"] == -1 else "$gt"
+    field, value = cursor["sort_field"], cursor["value"]
+    return {"$or": [
+        {field: {op: value}},
+        {field: value, "contract_id": {op: cursor["contract_id"]}},
+    ]}
@@ -20,9 +20,14 @@ class Contract(BaseModel):
     progress_message: str = "Task has been queued."
     error_message: Optional[str] = None
     file_path: str
+    file_size: int = 0
+    file_sha256: Optional[str] = None
     extracted_data: Optional[Dict[str, Any]] = None # This will store the structured data
     identified_gaps: Optional[List[str]] = None
     gaps_count: Optional[int] = None 
+    pipeline_version: Optional[str] = None
+    deduplicated_from: Optional[str] = None # contract_id whose results were reused
+    batch_id: Optional[str] = None # set when uploaded through /contracts/batch
 
 # --- Status Response Model  ---
 class StatusResponse(BaseModel):
@@ -32,6 +37,34 @@ class StatusResponse(BaseModel):
     progress_message: str
     error_message: Optional[str] = None
 
+# --- Bulk status lookup ---
+class BulkStatusRequest(BaseModel):
+    contract_ids: List[str]
+
+class BulkStatusEntry(BaseModel):
+    status: str
+    progress_percentage: int
+    progress_message: Optional[str] = None
+    error_message: Optional[str] = None
+
+class BulkStatusResponse(BaseModel):
+    statuses: Dict[str, BulkStatusEntry] # contract_id -> status
+    not_found: List[str] = []
+
+# --- Batch upload progress ---
+class BatchRejection(BaseModel):
+    file_name: str
+    reason: str
+
+class BatchProgressResponse(BaseModel):
+    batch_id: str
+    created_at: datetime
+    total: int
+    status_counts: Dict[str, int] # processing_status -> number of contracts
+    finished: int # completed or failed
+    progress_percentage: int # mean progress across the batch
+    rejected: List[BatchRejection] = []
+
 # --- Detailed Contract Data Response Model ---
 class ContractDataResponse(BaseModel):
     contract_id: str
@@ -53,8 +86,47 @@ class ContractSummary(BaseModel):
     
 # --- The structured response model for the paginated endpoint ---
 class PaginatedContractResponse(BaseModel):
-    total_items: int
+    total_items: Optional[int] = None # None when the count was skipped (count=none)
     items: List[ContractSummary]
     page: int
     size: int
-    
\ No newline at end of file
+    total_pages: Optional[int] = None
+    has_next: bool = False
+    has_prev: bool = False
+    next_cursor: Optional[str] = None # pass as ?cursor= to fetch the next page by keyset
+
+# --- Dashboard analytics ---
+class AnalyticsBucket(BaseModel):
+    period_start: datetime
+    total: int
+    completed: int
+    errors: int
+    avg_confidence: Optional[float] = None
+    avg_processing_seconds: Optional[float] = None
+
+class AnalyticsResponse(BaseModel):
+    total_contracts: int
+    by_status: Dict[str, int]
+    avg_confidence: Optional[float] = None
+    min_confidence: Optional[float] = None
+    avg_processing_seconds: Optional[float] = None
+    max_processing_seconds: Optional[float] = None
+    avg_gaps: Optional[float] = None
+    gaps_by_field: Dict[str, int]
+    bucket: str
+    buckets: List[AnalyticsBucket]
+    generated_at: datetime
+
+class DailyStats(BaseModel):
+    day: str # "YYYY-MM-DD", or "<from>..<to>" for totals
+    total: int
+    deduplicated: int = 0
+    counts: Dict[str, int] # by processing status
+    gaps: Dict[str, int] # by critical field
+    avg_confidence: Optional[float] = None
+    avg_processing_seconds: Optional[float] = None
+    processing_time_hist: Dict[str, int] # "le_<seconds>" / "gt_<seconds>" buckets
+
+class DailyStatsResponse(BaseModel):
+    days: List[DailyStats]
+    totals: DailyStats
@@ -1,21 +1,37 @@
+import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
 from core.config import settings
+from db.indexes import ensure_indexes
 
 class MongoDB:
     client: AsyncIOMotorClient = None
     db = None
+    index_task: asyncio.Task = None
 
 db = MongoDB()
 
+async def _ensure_indexes_in_background(database):
+    try:
+        await ensure_indexes(database)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        print(f"Index creation at startup failed: {e}")
+
 async def connect_to_mongo():
     print("Connecting to MongoDB...")
     # For MongoDB Atlas, use the connection string directly
     db.client = AsyncIOMotorClient(settings.MONGO_URI)
     db.db = db.client[settings.MONGO_DB_NAME]
+    if settings.ENSURE_INDEXES_ON_STARTUP:
+        # In the background: building an index on a large collection must not hold up startup
+        db.index_task = asyncio.create_task(_ensure_indexes_in_background(db.db))
     print("Successfully connected to MongoDB.")
 
 async def close_mongo_connection():
     print("Closing MongoDB connection...")
+    if db.index_task is not None and not db.index_task.done():
+        db.index_task.cancel()
     db.client.close()
     print("MongoDB connection closed.")
 
@@ -0,0 +1,66 @@
+import json
+from typing import Dict, List, Optional
+import redis.asyncio as aioredis
+from core.config import settings
+
+# Fast store for in-flight processing state. The worker writes progress here
+# (tasks/progress.py) and only writes MongoDB on terminal states, so status reads
+# check Redis first and fall back to the contract document. Every write is also
+# published on the contract's events channel for streaming subscribers.
+PROGRESS_KEY_PREFIX = "contract:progress"
+EVENTS_CHANNEL_PREFIX = "contract:events"
+TERMINAL_STATUSES = {"completed", "error"}
+
+# Serialized GET /contracts/{id} responses (services/result_cache.py). The worker
+# deletes a contract's entry and publishes its id on the invalidation channel
+# whenever it writes new results.
+RESULT_CACHE_KEY_PREFIX = "contract:result"
+RESULT_INVALIDATION_CHANNEL = "contract:result:invalidate"
+
+
+def progress_key(contract_id: str) -> str:
+    return f"{PROGRESS_KEY_PREFIX}:{contract_id}"
+
+
+def events_channel(contract_id: str) -> str:
+    return f"{EVENTS_CHANNEL_PREFIX}:{contract_id}"
+
+
+def result_cache_key(contract_id: str, pipeline_version: str) -> str:
+    return f"{RESULT_CACHE_KEY_PREFIX}:{pipeline_version}:{contract_id}"
+
+
+class RedisStore:
+    client: aioredis.Redis = None
+
+redis_store = RedisStore()
+
+async def connect_to_redis():
+    print("Connecting to Redis...")
+    redis_store.client = aioredis.from_url(settings.REDIS_URI, decode_responses=True)
+    print("Successfully connected to Redis.")
+
+async def close_redis_connection():
+    print("Closing Redis connection...")
+    if redis_store.client is not None:
+        await redis_store.client.close()
+    print("Redis connection closed.")
+
+def get_redis() -> aioredis.Redis:
+    return redis_store.client
+
+
+async def get_cached_progress(contract_id: str) -> Optional[dict]:
+    """Returns the progress snapshot for a contract, or None if Redis has none (or is unavailable)."""
+    return (await get_cached_progress_many([contract_id])).get(contract_id)
+
+
+async def get_cached_progress_many(contract_ids: List[str]) -> Dict[str, dict]:
+    if not contract_ids or redis_store.client is None:
+        return {}
+    try:
+        values = await redis_store.client.mget([progress_key(cid) for cid in contract_ids])
+    except aioredis.RedisError as e:
+        print(f"Redis progress lookup failed, falling back to MongoDB: {e}")
+        return {}
+    return {cid: json.loads(v) for cid, v in zip(contract_ids, values) if v}
@@ -0,0 +1,112 @@
+import os
+import time
+import threading
+from pymongo import MongoClient, monitoring
+from core.config import settings
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """Counts connection checkouts and how long callers waited for one."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.checkout_failures = 0
+            self.connections_created = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "connections_created": self.connections_created,
+                "wait_ms_total": round(self.wait_seconds_total * 1000, 2),
+                "wait_ms_avg": round(self.wait_seconds_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.wait_seconds_max * 1000, 2),
+            }
+
+    def _waited(self) -> float:
+        started = getattr(self._local, "started", None)
+        return time.perf_counter() - started if started is not None else 0.0
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        waited = self._waited()
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def connection_check_out_failed(self, event):
+        waited = self._waited()
+        with self._lock:
+            self.checkout_failures += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def connection_created(self, event):
+        with self._lock:
+            self.connections_created += 1
+
+    def pool_created(self, event): pass
+    def pool_ready(self, event): pass
+    def pool_cleared(self, event): pass
+    def pool_closed(self, event): pass
+    def connection_ready(self, event): pass
+    def connection_closed(self, event): pass
+    def connection_checked_in(self, event): pass
+
+
+class WorkerMongoDB:
+    """Process-wide synchronous client for Celery worker processes."""
+    client: MongoClient = None
+    pid: int = None
+    metrics = PoolMetrics()
+
+
+worker_db = WorkerMongoDB()
+
+
+def connect_worker_mongo():
+    # MongoClient is not fork-safe: each worker process must build its own
+    if worker_db.client is not None and worker_db.pid == os.getpid():
+        return
+    print("Connecting worker to MongoDB...")
+    worker_db.client = MongoClient(
+        settings.MONGO_URI,
+        maxPoolSize=settings.WORKER_MONGO_MAX_POOL_SIZE,
+        minPoolSize=settings.WORKER_MONGO_MIN_POOL_SIZE,
+        connectTimeoutMS=settings.WORKER_MONGO_CONNECT_TIMEOUT_MS,
+        serverSelectionTimeoutMS=settings.WORKER_MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        waitQueueTimeoutMS=settings.WORKER_MONGO_WAIT_QUEUE_TIMEOUT_MS or None,
+        event_listeners=[worker_db.metrics],
+    )
+    worker_db.pid = os.getpid()
+    worker_db.metrics.reset()
+    print("Worker MongoDB client ready.")
+
+
+def close_worker_mongo():
+    if worker_db.client is None or worker_db.pid != os.getpid():
+        return
+    print(f"Closing worker MongoDB client. Pool metrics: {worker_db.metrics.snapshot()}")
+    worker_db.client.close()
+    worker_db.client = None
+
+
+def get_worker_collection(name: str):
+    connect_worker_mongo()
+    return worker_db.client[settings.MONGO_DB_NAME][name]
+
+
+def worker_pool_metrics() -> dict:
+    return worker_db.metrics.snapshot()
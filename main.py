@@ -1,8 +1,11 @@
 from fastapi import FastAPI
-from api import contracts
+from api import contracts, analytics
 from db.mongodb import connect_to_mongo, close_mongo_connection
+from db.redis_store import connect_to_redis, close_redis_connection
+from services.result_cache import result_cache
 from fastapi.middleware.cors import CORSMiddleware
 from core.config import settings
+from core.request_limits import BodySizeLimitMiddleware, MULTIPART_OVERHEAD_BYTES
 
 app = FastAPI(
     title="Contract Intelligence API",
@@ -10,6 +13,16 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Refuse oversized uploads before Starlette spools the multipart body to disk.
+# Added before CORSMiddleware so CORS wraps it and browsers can read its 413s.
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    limits={
+        "/api/v1/contracts/upload": settings.MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES,
+        "/api/v1/contracts/batch": settings.MAX_BATCH_UPLOAD_BYTES,
+    },
+)
+
 # CORS
 _origins = [o.strip() for o in (settings.CORS_ALLOW_ORIGINS or "").split(",") if o.strip()] or ["*"]
 _methods = [m.strip() for m in (settings.CORS_ALLOW_METHODS or "").split(",") if m.strip()] or ["*"]
@@ -27,13 +40,18 @@ app.add_middleware(
 @app.on_event("startup")
 async def startup_event():
     await connect_to_mongo()
+    await connect_to_redis()
+    result_cache.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await result_cache.stop()
     await close_mongo_connection()
+    await close_redis_connection()
 
 # Includes the API router
 app.include_router(contracts.router, prefix="/api/v1")
+app.include_router(analytics.router, prefix="/api/v1")
 
 @app.get("/")
 def read_root():
@@ -1,41 +1,118 @@
-import fitz
 import re
-import spacy
-import pdfplumber
+import time
 import nltk
-from sentence_transformers import SentenceTransformer, util
-from typing import Dict, Any, List
-
-# Load models at module level
-try:
-    nlp = spacy.load("en_core_web_sm")
-    print("SpaCy model 'en_core_web_sm' loaded successfully.")
-except OSError:
-    print("SpaCy model not found. Please run: python -m spacy download en_core_web_sm")
-    nlp = None
-
-try:
-    semantic_model = SentenceTransformer('all-MiniLM-L6-v2')
-    print("Sentence Transformer model 'all-MiniLM-L6-v2' loaded successfully.")
-except Exception as e:
-    print(f"Error loading sentence transformer: {e}")
-    semantic_model = None
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple, Union
 
-def analyze_contract_advanced(file_path: str) -> Dict[str, Any]:
+from core.config import settings
+from services.parsed_document import ParsedDocument
+from services.embeddings import get_prototype_embeddings
+from services.model_registry import get_nlp, get_semantic_model, ner_disabled_pipes
+from services.field_summary import CRITICAL_FIELDS
+
+# A short, realistic contract used to exercise every strategy once before real traffic arrives
+WARM_UP_CONTRACT = (
+    "MASTER SERVICES AGREEMENT. This Agreement is entered into by and between Acme Corporation "
+    "and Globex Industries Inc. The authorized representatives: Jane Smith. Payment terms are Net 30. "
+    "Customer shall pay $1,000 per month. The term of this Agreement is one year and it will "
+    "automatically renew for successive one-year terms unless either party gives notice to terminate.\n"
+    "By: Name: John Doe\nTitle: Chief Executive Officer\n"
+)
+
+# Prototype sentences per renewal category; a category may list several phrasings
+RENEWAL_PROTOTYPES = {
+    "Affirmative Renewal": ["The contract will automatically renew."],
+    "Negative Renewal": ["The contract will not automatically renew."],
+    "Conditional Renewal": ["The contract renews unless one party acts to terminate it."],
+}
+
+# Where the preamble (title, parties, recitals) ends: the operative clause or the first numbered section.
+# Keywords match in any case; "1. Heading" stays case-sensitive so "1. the ..." inside a recital doesn't end it.
+PREAMBLE_END_PATTERN = re.compile(
+    r"(?i:\bnow,?\s+therefore\b|\bin\s+consideration\s+of\b|^\s*(?:article|section)\s+(?:1|i)\b)|^\s*1\.\s+[A-Z]",
+    re.MULTILINE,
+)
+# Party introductions; the end of the preamble is searched for after the first one
+PARTIES_ANCHOR_PATTERN = re.compile(r"\b(?:by and between|between|entered into|made by)\b", re.IGNORECASE)
+
+def load_models() -> bool:
+    """Loads every model the pipeline needs (and the prototype matrix); returns True if all are available."""
+    nlp, semantic_model = get_nlp(), get_semantic_model()
     if not nlp or not semantic_model:
+        return False
+    get_prototype_embeddings(semantic_model, settings.SEMANTIC_MODEL_NAME, RENEWAL_PROTOTYPES)
+    return True
+
+def warm_up() -> bool:
+    """Loads all models and runs the full pipeline once on a synthetic contract."""
+    start = time.perf_counter()
+    if not load_models():
+        return False
+    try:
+        nltk.sent_tokenize("Warm up the sentence tokenizer. It loads punkt on first use.")
+    except LookupError as e:
+        print(f"NLTK punkt is not available, sentence splitting will fall back to periods: {e}")
+    ContractProcessor("<warm-up>", document=ParsedDocument.from_text(WARM_UP_CONTRACT)).process()
+    print(f"NLP pipeline warmed up in {time.perf_counter() - start:.2f}s")
+    return True
+
+def analyze_contract_advanced(file_path: str) -> Dict[str, Any]:
+    if not load_models():
         raise RuntimeError("A required NLP model failed to load. Cannot process documents.")
     processor = ContractProcessor(file_path)
     return processor.process()
 
+def _org_names(doc) -> List[str]:
+    return [ent.text.strip() for ent in doc.ents if ent.label_ == "ORG"]
+
+def find_orgs(text: str) -> List[str]:
+    nlp = get_nlp()
+    # Only NER is needed: anything else still in the pipeline is switched off for the call
+    with nlp.select_pipes(disable=ner_disabled_pipes(nlp)):
+        return _org_names(nlp(text))
+
+def find_orgs_many(texts: List[str]) -> List[List[str]]:
+    """ORG entities per text, run through nlp.pipe with SPACY_PIPE_BATCH_SIZE / SPACY_N_PROCESS."""
+    nlp = get_nlp()
+    with nlp.select_pipes(disable=ner_disabled_pipes(nlp)):
+        docs = nlp.pipe(texts, batch_size=settings.SPACY_PIPE_BATCH_SIZE, n_process=settings.SPACY_N_PROCESS)
+        return [_org_names(doc) for doc in docs]
+
+def prepare_contracts_batch(file_paths: List[str]) -> List[Tuple[Union["ContractProcessor", Exception], Optional[List[str]]]]:
+    """
+    Parses several contracts and runs party NER for all of their preambles
+    through one nlp.pipe call. Returns (processor, preamble_orgs) per file, or
+    (exception, None) when it could not be parsed; processor.process(preamble_orgs=...)
+    then finishes each contract on its own.
+    """
+    if not load_models():
+        raise RuntimeError("A required NLP model failed to load. Cannot process documents.")
+    processors = []
+    for file_path in file_paths:
+        try:
+            processors.append(ContractProcessor(file_path))
+        except Exception as e:
+            processors.append(e)
+    parsed = [processor for processor in processors if isinstance(processor, ContractProcessor)]
+    start = time.perf_counter()
+    orgs_per_contract = iter(find_orgs_many([processor.preamble_text() for processor in parsed]))
+    print(f"Batched party NER over {len(parsed)} preambles in {time.perf_counter() - start:.2f}s")
+    return [
+        (processor, next(orgs_per_contract)) if isinstance(processor, ContractProcessor) else (processor, None)
+        for processor in processors
+    ]
+
 class ContractProcessor:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, document: ParsedDocument = None):
         self.file_path = file_path
-        self.full_text = self._get_full_text()
+        self.document = document if document is not None else self._parse_document()
+        self.full_text = self.document.full_text
         self.found_fields = {}
+        self.metrics = {}
 
-    def process(self) -> Dict[str, Any]:
-        """Orchestrates the entire extraction pipeline."""
-        self._extract_with_ner_and_context()
+    def process(self, preamble_orgs: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Orchestrates the entire extraction pipeline. preamble_orgs: ORG entities of preamble_text(), if already found."""
+        self._extract_with_ner_and_context(preamble_orgs)
         self._extract_with_regex()
         self._extract_with_layout_parser()
         self._extract_with_semantic_classifier()
@@ -48,22 +125,29 @@ class ContractProcessor:
 
         return self._structure_and_finalize()
     
-    def _get_full_text(self) -> str:
+    def _parse_document(self) -> ParsedDocument:
+        """Parses the PDF once; every strategy reads from the shared result."""
         try:
-            with fitz.open(self.file_path) as doc:
-                return "".join(page.get_text() for page in doc)
+            return ParsedDocument.from_path(self.file_path)
         except Exception as e:
             print(f"Error reading PDF with PyMuPDF: {e}")
-            return ""
+            return ParsedDocument([])
 
     # --- STRATEGY 1: NER ---
-    def _extract_with_ner_and_context(self):
+    def _extract_with_ner_and_context(self, preamble_orgs: Optional[List[str]] = None):
         """Extracts Party names and searches for authorized representative"""
-        text_chunk_for_parties = self.full_text[:50000]
-        doc = nlp(text_chunk_for_parties)
-        
-        # 1. Find Party Names 
-        orgs = [ent.text.strip() for ent in doc.ents if ent.label_ == "ORG"]
+        # 1. Find Party Names: NER over the preamble only, widening the window if it names fewer than two
+        start = time.perf_counter()
+        preamble = self.preamble_text()
+        orgs = preamble_orgs if preamble_orgs is not None else find_orgs(preamble)
+        self.metrics["ner_chars"] = len(preamble)
+        self.metrics["ner_batched"] = preamble_orgs is not None
+        wider = self.full_text[:settings.NER_FALLBACK_CHARS]
+        self.metrics["ner_fallback"] = len(orgs) < 2 and len(wider) > len(preamble)
+        if self.metrics["ner_fallback"]:
+            orgs = find_orgs(wider)
+            self.metrics["ner_chars"] += len(wider)
+        self.metrics["ner_seconds"] = round(time.perf_counter() - start, 4)
         if len(orgs) >= 2:
             self.found_fields["customer_name"] = {"value": orgs[0], "confidence_score": 0.75}
             self.found_fields["vendor_name"] = {"value": orgs[1], "confidence_score": 0.75}
@@ -106,61 +190,80 @@ class ContractProcessor:
 
     # --- Finalizing function  ---
     def _structure_and_finalize(self) -> Dict[str, Any]:
-        CRITICAL_FIELDS_CHECKLIST = ["customer_name", "vendor_name", "authorized_signatory", "payment_terms", "billing_cycle", "renewal_terms"]
-        identified_gaps = [field for field in CRITICAL_FIELDS_CHECKLIST if not self.found_fields.get(field)]
+        identified_gaps = [field for field in CRITICAL_FIELDS if not self.found_fields.get(field)]
         structured_data = {
             "party_identification": {"customer": self.found_fields.get("customer_name"), "vendor": self.found_fields.get("vendor_name"), "authorized_signatories": self.found_fields.get("authorized_signatory")},
             "payment_structure": {"payment_terms": self.found_fields.get("payment_terms")},
             "revenue_classification": {"billing_cycle": self.found_fields.get("billing_cycle"), "renewal_terms": self.found_fields.get("renewal_terms")},
         }
-        return {"extracted_data": structured_data, "identified_gaps": identified_gaps}
+        return {"extracted_data": structured_data, "identified_gaps": identified_gaps, "metrics": self.metrics}
 
     # --- Helper Methods  ---
+    def preamble_text(self) -> str:
+        """The title/parties/recitals span: from the start of the document to where the operative clauses begin."""
+        max_pages = settings.NER_PREAMBLE_MAX_PAGES
+        offsets = self.document.page_offsets
+        window_end = offsets[max_pages] if len(offsets) > max_pages else len(self.full_text)
+        window = self.full_text[:min(window_end, settings.NER_PREAMBLE_MAX_CHARS)]
+        anchor = PARTIES_ANCHOR_PATTERN.search(window)
+        end = PREAMBLE_END_PATTERN.search(window, anchor.end() if anchor else 0)
+        return window[:end.start()] if end else window
+
     def _find_field_regex(self, text: str, patterns: List[str], confidence: float, group: int = 1) -> Dict[str, Any]:
         for pattern in patterns:
             match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
             if match and len(match.groups()) >= group:
                 value = match.group(group).strip().replace('\n', ' ')
-                return {"value": value, "confidence_score": confidence, "source_snippet": match.group(0).strip()[:250]}
+                found = {"value": value, "confidence_score": confidence, "source_snippet": match.group(0).strip()[:250]}
+                # Matches against the whole document can be traced back to their page
+                if text is self.full_text and self.document.pages:
+                    found["source_page"] = self.document.page_for_offset(match.start())
+                return found
         return None
 
     def _find_signatory_by_layout(self) -> Dict[str, Any]:
-        try:
-            with pdfplumber.open(self.file_path) as pdf:
-                last_page = pdf.pages[-1]
-                signature_zone = last_page.crop((0, last_page.height * 0.70, last_page.width, last_page.height))
-                text_in_zone = signature_zone.extract_text()
-                if not text_in_zone: return None
-                patterns = [r"By:\s*Name:\s*(.*?)\n", r"By:\s*([^\n]+)\n\s*Title:"]
-                match = self._find_field_regex(text_in_zone, patterns, 0.98)
-                if match:
-                    match["source_snippet"] = f"Found in signature zone on page {len(pdf.pages)}: " + match["source_snippet"]
-                    return match
-        except Exception as e:
-            print(f"Error processing with pdfplumber: {e}")
+        last_page = self.document.last_page
+        if last_page is None: return None
+        text_in_zone = last_page.text_in_region(0, last_page.height * 0.70, last_page.width, last_page.height)
+        if not text_in_zone: return None
+        patterns = [r"By:\s*Name:\s*(.*?)\n", r"By:\s*([^\n]+)\n\s*Title:"]
+        match = self._find_field_regex(text_in_zone, patterns, 0.98)
+        if match:
+            match["source_snippet"] = f"Found in signature zone on page {last_page.number}: " + match["source_snippet"]
+            match["source_page"] = last_page.number
+            return match
         return None
 
     def _classify_renewal_clause_chunked(self) -> Dict[str, Any]:
-        categories = {"Affirmative Renewal": "The contract will automatically renew.","Negative Renewal": "The contract will not automatically renew.","Conditional Renewal": "The contract renews unless one party acts to terminate it."}
-        category_embeddings = semantic_model.encode(list(categories.values()))
-        best_match = {"score": 0, "sentence": None, "category": None}
+        semantic_model = get_semantic_model()
+        category_labels, category_embeddings = get_prototype_embeddings(semantic_model, settings.SEMANTIC_MODEL_NAME, RENEWAL_PROTOTYPES)
         try:
-            with fitz.open(self.file_path) as doc:
-                for page_num in range(len(doc)):
-                    page_text = doc.load_page(page_num).get_text()
-                    try: sentences = nltk.sent_tokenize(page_text)
-                    except Exception: sentences = page_text.split('.')
-                    candidate_sentences = [s for s in sentences if re.search(r'\b(renew|term|terminate|evergreen)\b', s, re.IGNORECASE)]
-                    if not candidate_sentences: continue
-                    for sentence in candidate_sentences:
-                        sentence_embedding = semantic_model.encode(sentence)
-                        scores = util.cos_sim(sentence_embedding, category_embeddings)[0]
-                        top_score, top_idx = max(zip(scores, range(len(scores))))
-                        if top_score > best_match["score"]:
-                            best_match.update({"score": top_score, "sentence": sentence.strip(), "category": list(categories.keys())[top_idx]})
+            # 1. Collect candidate sentences across the whole document
+            candidates = []
+            for page in self.document.pages:
+                page_text = page.text
+                try: sentences = nltk.sent_tokenize(page_text)
+                except Exception: sentences = page_text.split('.')
+                candidates.extend((s, page.number) for s in sentences if re.search(r'\b(renew|term|terminate|evergreen)\b', s, re.IGNORECASE))
+            batch_size = settings.SEMANTIC_BATCH_SIZE
+            self.metrics["semantic_embeddings"] = len(candidates)
+            self.metrics["semantic_batches"] = -(-len(candidates) // batch_size)
+            if not candidates:
+                self.metrics["semantic_encode_seconds"] = 0.0
+                return None
+
+            # 2. Encode them in batches, then score everything with one matrix multiply
+            start = time.perf_counter()
+            sentence_embeddings = semantic_model.encode([s for s, _ in candidates], batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True)
+            self.metrics["semantic_encode_seconds"] = round(time.perf_counter() - start, 4)
+            print(f"Encoded {len(candidates)} candidate sentences in {self.metrics['semantic_batches']} batches ({self.metrics['semantic_encode_seconds']}s, batch_size={batch_size})")
+            scores = sentence_embeddings @ category_embeddings.T
+            best_row, best_col = np.unravel_index(np.argmax(scores), scores.shape)
         except Exception as e:
             print(f"Error during chunked processing: {e}")
             return None
-        if best_match["score"] > 0.5:
-            return {"value": {"classification": best_match["category"], "text": best_match["sentence"]},"confidence_score": float(best_match["score"]),"source_snippet": best_match["sentence"]}
-        return None
\ No newline at end of file
+        top_score = float(scores[best_row, best_col])
+        if top_score > 0.5:
+            sentence, page_number = candidates[best_row]
+            return {"value": {"classification": category_labels[best_col], "text": sentence.strip()},"confidence_score": top_score,"source_snippet": sentence.strip(),"source_page": page_number}
+        return None
@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import List, Optional
+
+# Per-day counters maintained incrementally with $inc as contracts finish, so the
+# dashboard reads one small document per day instead of scanning contracts.
+# Documents are keyed by the UTC day ("YYYY-MM-DD") the contract finished on.
+STATS_COLLECTION = "contract_stats_daily"
+
+# Upper bounds (seconds) of the processing-time histogram buckets
+PROCESSING_TIME_BUCKETS = [1, 2, 5, 10, 30, 60, 120, 300]
+
+
+def stats_day(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%d")
+
+
+def processing_time_bucket(seconds: float) -> str:
+    for bound in PROCESSING_TIME_BUCKETS:
+        if seconds <= bound:
+            return f"le_{bound}"
+    return f"gt_{PROCESSING_TIME_BUCKETS[-1]}"
+
+
+def build_daily_stats_update(
+    status: str,
+    identified_gaps: Optional[List[str]] = None,
+    avg_confidence: Optional[float] = None,
+    processing_seconds: Optional[float] = None,
+    deduplicated: bool = False,
+) -> dict:
+    """The $inc update recording one finished contract in its day's stats document."""
+    inc = {"total": 1, f"counts.{status}": 1}
+    if deduplicated:
+        inc["deduplicated"] = 1
+    for field in identified_gaps or []:
+        inc[f"gaps.{field}"] = 1
+    if avg_confidence is not None:
+        inc["confidence_sum"] = avg_confidence
+        inc["confidence_count"] = 1
+    if processing_seconds is not None:
+        inc["processing_seconds_sum"] = processing_seconds
+        inc["processing_seconds_count"] = 1
+        inc[f"processing_time_hist.{processing_time_bucket(processing_seconds)}"] = 1
+    return {"$inc": inc}
@@ -0,0 +1,70 @@
+import os
+import sys
+import json
+import hashlib
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from core.config import settings
+
+# In-memory tier, keyed the same way as the on-disk files
+_prototype_cache: Dict[str, np.ndarray] = {}
+
+
+def prototype_cache_key(model_name: str, prototypes: Dict[str, List[str]]) -> str:
+    """Stable key for a model and an ordered set of labelled prototype sentences."""
+    payload = json.dumps({"model": model_name, "prototypes": prototypes}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_prototype_embeddings(model, model_name: str, prototypes: Dict[str, List[str]]) -> Tuple[List[str], np.ndarray]:
+    """
+    Returns (row_labels, matrix) where each row of the normalized matrix embeds one
+    prototype sentence and row_labels[i] is its category. The matrix is computed
+    once per model and prototype set, then served from memory or the disk cache.
+    """
+    row_labels = [label for label, texts in prototypes.items() for _ in texts]
+    key = prototype_cache_key(model_name, prototypes)
+    if key in _prototype_cache:
+        return row_labels, _prototype_cache[key]
+
+    cache_path = Path(settings.EMBEDDINGS_CACHE_DIR) / f"{key}.npy"
+    matrix = None
+    if cache_path.exists():
+        try:
+            matrix = np.load(cache_path)
+            if matrix.shape[0] != len(row_labels):
+                matrix = None
+        except Exception as e:
+            print(f"Ignoring unreadable embedding cache {cache_path}: {e}")
+            matrix = None
+
+    if matrix is None:
+        texts = [text for texts in prototypes.values() for text in texts]
+        matrix = model.encode(texts, convert_to_numpy=True, normalize_embeddings=True).astype(np.float32)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp.npy")
+            np.save(tmp_path, matrix)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Could not persist embedding cache {cache_path}: {e}")
+
+    _prototype_cache[key] = matrix
+    return row_labels, matrix
+
+
+def main():
+    """Builds the prototype matrices into EMBEDDINGS_CACHE_DIR, e.g. at image build time."""
+    from services.model_registry import get_semantic_model
+    from services.contract_processor import RENEWAL_PROTOTYPES
+    model = get_semantic_model()
+    if model is None:
+        sys.exit("Sentence transformer could not be loaded.")
+    get_prototype_embeddings(model, settings.SEMANTIC_MODEL_NAME, RENEWAL_PROTOTYPES)
+    print(f"Prototype embeddings cached in {settings.EMBEDDINGS_CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+import io
+import csv
+import orjson
+from typing import Any, AsyncIterator, Dict, List, Optional
+from starlette.concurrency import run_in_threadpool
+
+from core.config import settings
+from db.keyset import encode_cursor
+from services.field_summary import CRITICAL_FIELDS
+
+# Exports walk contracts in (upload_timestamp, contract_id) order, so every row
+# carries a resume_cursor: pass the last one received back as ?cursor= to
+# continue after an interrupted download.
+EXPORT_SORT_FIELD = "upload_timestamp"
+EXPORT_SORT_DIRECTION = 1
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Top-level fields an export may select, in column order
+EXPORTABLE_FIELDS = [
+    "contract_id", "file_name", "upload_timestamp", "processing_status", "pipeline_version",
+    "file_size", "file_sha256", "gaps_count", "identified_gaps", "min_confidence", "avg_confidence",
+    "extracted_data",
+]
+
+
+class ExportFormatUnavailableError(Exception):
+    pass
+
+
+def export_projection(fields: List[str]) -> dict:
+    """Only the selected fields, plus the sort key every row's resume cursor is built from."""
+    projection = {"_id": 0, "contract_id": 1, EXPORT_SORT_FIELD: 1}
+    projection.update({field: 1 for field in fields})
+    return projection
+
+
+def resume_cursor(document: dict) -> str:
+    return encode_cursor(EXPORT_SORT_FIELD, EXPORT_SORT_DIRECTION, document)
+
+
+# --- Tabular (CSV / Parquet) rows ---
+def tabular_columns(fields: List[str]) -> List[str]:
+    """extracted_data is flattened into <field> / <field>_confidence columns per critical field."""
+    columns = []
+    for field in fields:
+        if field == "extracted_data":
+            for name in CRITICAL_FIELDS:
+                columns += [name, f"{name}_confidence"]
+        else:
+            columns.append(field)
+    return columns + ["resume_cursor"]
+
+
+def _cell(value: Any) -> Any:
+    # Nested values (e.g. renewal_terms' classification + text) stay as a JSON string
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value).decode("utf-8")
+    return value
+
+
+def flatten_record(document: dict, fields: List[str]) -> Dict[str, Any]:
+    row = {}
+    for field in fields:
+        if field == "extracted_data":
+            extracted = document.get("extracted_data") or {}
+            for name, (section, key) in CRITICAL_FIELDS.items():
+                found = (extracted.get(section) or {}).get(key) or {}
+                row[name] = _cell(found.get("value"))
+                row[f"{name}_confidence"] = found.get("confidence_score")
+        elif field == "identified_gaps":
+            row[field] = ";".join(document.get(field) or [])
+        else:
+            row[field] = _cell(document.get(field))
+    row["resume_cursor"] = resume_cursor(document)
+    return row
+
+
+# --- Encoders: each consumes a Mongo cursor and yields byte chunks of roughly one batch ---
+async def _batches(cursor, batch_rows: int) -> AsyncIterator[List[dict]]:
+    batch = []
+    async for document in cursor:
+        batch.append(document)
+        if len(batch) >= batch_rows:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def ndjson_chunks(cursor, fields: List[str], batch_rows: int) -> AsyncIterator[bytes]:
+    async for batch in _batches(cursor, batch_rows):
+        lines = []
+        for document in batch:
+            record = {field: document.get(field) for field in fields}
+            record["resume_cursor"] = resume_cursor(document)
+            lines.append(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        yield b"".join(lines)
+
+
+async def csv_chunks(cursor, fields: List[str], batch_rows: int) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=tabular_columns(fields))
+    writer.writeheader()
+    async for batch in _batches(cursor, batch_rows):
+        writer.writerows(flatten_record(document, fields) for document in batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Header only: nothing matched
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink:
+    """
+    Write-only file object for ParquetWriter. Bytes are drained after every row
+    group, while tell() keeps counting so the footer's offsets stay correct.
+    """
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _parquet_schema(pa, fields: List[str]):
+    types = {
+        "upload_timestamp": pa.timestamp("ms"),
+        "file_size": pa.int64(),
+        "gaps_count": pa.int64(),
+        "min_confidence": pa.float64(),
+        "avg_confidence": pa.float64(),
+    }
+    for name in CRITICAL_FIELDS:
+        types[f"{name}_confidence"] = pa.float64()
+    return pa.schema([(column, types.get(column, pa.string())) for column in tabular_columns(fields)])
+
+
+def require_format(export_format: str):
+    """Raises ExportFormatUnavailableError when the format's dependency is missing, e.g. on installs without pyarrow."""
+    if export_format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ExportFormatUnavailableError("Parquet export requires pyarrow; install it or use format=ndjson/csv.")
+
+
+async def parquet_chunks(cursor, fields: List[str], batch_rows: int) -> AsyncIterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema(pa, fields)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        # One row group per batch; encoding and compression run off the event loop
+        async for batch in _batches(cursor, batch_rows):
+            table = pa.Table.from_pylist([flatten_record(document, fields) for document in batch], schema=schema)
+            await run_in_threadpool(writer.write_table, table)
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+EXPORT_ENCODERS = {"ndjson": ndjson_chunks, "csv": csv_chunks, "parquet": parquet_chunks}
+
+
+def export_chunks(export_format: str, cursor, fields: List[str], batch_rows: Optional[int] = None) -> AsyncIterator[bytes]:
+    return EXPORT_ENCODERS[export_format](cursor, fields, batch_rows or settings.EXPORT_BATCH_ROWS)
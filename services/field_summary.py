@@ -0,0 +1,64 @@
+import re
+from typing import Any, Dict, Iterable, Optional
+
+# Critical fields and where each lives in extracted_data. The order fixes each
+# field's bit in present_fields_mask, so only ever append to this list.
+CRITICAL_FIELDS = {
+    "customer_name": ("party_identification", "customer"),
+    "vendor_name": ("party_identification", "vendor"),
+    "authorized_signatory": ("party_identification", "authorized_signatories"),
+    "payment_terms": ("payment_structure", "payment_terms"),
+    "billing_cycle": ("revenue_classification", "billing_cycle"),
+    "renewal_terms": ("revenue_classification", "renewal_terms"),
+}
+FIELD_BITS = {name: 1 << i for i, name in enumerate(CRITICAL_FIELDS)}
+
+# Names the frontend's "required fields" filter uses for groups of our fields
+FIELD_ALIASES = {
+    "parties": ["customer_name", "vendor_name"],
+    "key_clauses": ["renewal_terms"],
+    "signatory": ["authorized_signatory"],
+}
+
+
+def get_extracted_field(extracted_data: Dict[str, Any], name: str):
+    section, key = CRITICAL_FIELDS[name]
+    return ((extracted_data or {}).get(section) or {}).get(key)
+
+
+def summarize_extracted_fields(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Precomputed, indexable summary of a result: confidence min/avg and a bitmask of present fields."""
+    mask = 0
+    scores = []
+    for name in CRITICAL_FIELDS:
+        field = get_extracted_field(extracted_data, name)
+        if field:
+            mask |= FIELD_BITS[name]
+            scores.append(float(field.get("confidence_score", 0)))
+    return {
+        "present_fields_mask": mask,
+        "min_confidence": min(scores) if scores else None,
+        "avg_confidence": sum(scores) / len(scores) if scores else None,
+    }
+
+
+FIELD_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+
+
+def required_fields_mask(names: Iterable[str]) -> Optional[int]:
+    """
+    Bitmask for a list of field names or aliases. Returns None when a name is a
+    field the pipeline never extracts (e.g. contract_value), since no contract
+    can have it; raises ValueError for names that are not field names at all.
+    """
+    mask = 0
+    satisfiable = True
+    for name in names:
+        if not FIELD_NAME_PATTERN.match(name):
+            raise ValueError(f"Malformed field name: {name!r}")
+        for field in FIELD_ALIASES.get(name, [name]):
+            if field in FIELD_BITS:
+                mask |= FIELD_BITS[field]
+            else:
+                satisfiable = False
+    return mask if satisfiable else None
@@ -0,0 +1,76 @@
+import threading
+from typing import Any, Callable, Dict, List
+
+from core.config import settings
+
+# Heavy NLP models, loaded on first use. Nothing here is imported until a loader
+# runs, so processes that never analyze a contract (the API) never pull in torch.
+_models: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def _get_or_load(name: str, loader: Callable[[], Any]) -> Any:
+    model = _models.get(name)
+    if model is not None:
+        return model
+    with _lock:
+        if name not in _models:
+            try:
+                _models[name] = loader()
+            except Exception as e:
+                # Not cached: a later call gets another chance to load it
+                print(f"Error loading model '{name}': {e}")
+                return None
+        return _models[name]
+
+
+def spacy_exclude() -> List[str]:
+    return [name.strip() for name in settings.SPACY_EXCLUDE.split(",") if name.strip()]
+
+
+def load_spacy_pipeline(exclude: List[str]):
+    """Loads SPACY_MODEL_NAME without the excluded components (and without a tok2vec nothing listens to)."""
+    import spacy
+    nlp = spacy.load(settings.SPACY_MODEL_NAME, exclude=exclude)
+    # ner has its own tok2vec in the en_core_web_* models; the shared one only feeds tagger/parser
+    if exclude and "tok2vec" in nlp.pipe_names and not getattr(nlp.get_pipe("tok2vec"), "listening_components", ["?"]):
+        nlp.remove_pipe("tok2vec")
+    return nlp
+
+
+def _load_spacy():
+    # The pipeline only reads entities, so components nothing uses are never loaded
+    try:
+        nlp = load_spacy_pipeline(spacy_exclude())
+    except OSError:
+        print(f"SpaCy model not found. Please run: python -m spacy download {settings.SPACY_MODEL_NAME}")
+        raise
+    print(f"SpaCy model '{settings.SPACY_MODEL_NAME}' loaded successfully with pipes {nlp.pipe_names}.")
+    return nlp
+
+
+def _load_sentence_transformer():
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(settings.SEMANTIC_MODEL_NAME)
+    print(f"Sentence Transformer model '{settings.SEMANTIC_MODEL_NAME}' loaded successfully.")
+    return model
+
+
+def get_nlp():
+    return _get_or_load("spacy", _load_spacy)
+
+
+# Components party NER never reads; normally already excluded at load (SPACY_EXCLUDE)
+NER_UNUSED_PIPES = ("tagger", "parser", "senter", "attribute_ruler", "lemmatizer")
+
+
+def ner_disabled_pipes(nlp) -> List[str]:
+    """Pipes to disable (nlp.select_pipes) for NER-only runs; tok2vec stays on only if ner listens to it."""
+    disabled = [name for name in NER_UNUSED_PIPES if name in nlp.pipe_names]
+    if "tok2vec" in nlp.pipe_names and "ner" not in getattr(nlp.get_pipe("tok2vec"), "listening_components", ["ner"]):
+        disabled.append("tok2vec")
+    return disabled
+
+
+def get_semantic_model():
+    return _get_or_load("sentence_transformer", _load_sentence_transformer)
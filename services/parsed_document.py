@@ -0,0 +1,68 @@
+import fitz
+from bisect import bisect_right
+from typing import List, Tuple, Optional
+
+# A word as returned by PyMuPDF: (x0, y0, x1, y1, text, block_no, line_no, word_no)
+Word = Tuple[float, float, float, float, str, int, int, int]
+
+
+class ParsedPage:
+    def __init__(self, number: int, text: str, width: float, height: float, words: List[Word]):
+        self.number = number  # 1-based page number
+        self.text = text
+        self.width = width
+        self.height = height
+        self.words = words
+
+    def text_in_region(self, x0: float, y0: float, x1: float, y1: float) -> str:
+        """Rebuilds the text of the words whose top-left corner falls inside the given box, line by line."""
+        lines = {}
+        for w in self.words:
+            if x0 <= w[0] <= x1 and y0 <= w[1] <= y1:
+                lines.setdefault((w[5], w[6]), []).append(w)
+        ordered = sorted(lines.values(), key=lambda ws: (round(ws[0][1], 1), ws[0][0]))
+        return "\n".join(" ".join(w[4] for w in sorted(ws, key=lambda w: w[7])) for ws in ordered)
+
+
+class ParsedDocument:
+    """
+    A PDF parsed exactly once: per-page text, the character offset of each page
+    within the full text, and the word/bbox layout every extraction strategy needs.
+    """
+    def __init__(self, pages: List[ParsedPage]):
+        self.pages = pages
+        self.page_offsets = []
+        offset = 0
+        for page in pages:
+            self.page_offsets.append(offset)
+            offset += len(page.text)
+        self.full_text = "".join(page.text for page in pages)
+
+    @classmethod
+    def from_path(cls, file_path: str) -> "ParsedDocument":
+        pages = []
+        with fitz.open(file_path) as doc:
+            for i, page in enumerate(doc):
+                pages.append(ParsedPage(
+                    number=i + 1,
+                    text=page.get_text(),
+                    width=page.rect.width,
+                    height=page.rect.height,
+                    words=page.get_text("words"),
+                ))
+        return cls(pages)
+
+    @classmethod
+    def from_text(cls, text: str) -> "ParsedDocument":
+        """Builds a single-page document without layout, e.g. for model warm-up."""
+        return cls([ParsedPage(number=1, text=text, width=612, height=792, words=[])])
+
+    @property
+    def last_page(self) -> Optional[ParsedPage]:
+        return self.pages[-1] if self.pages else None
+
+    def page_for_offset(self, offset: int) -> Optional[int]:
+        """Returns the 1-based page number containing the given offset into full_text."""
+        if not self.pages:
+            return None
+        return bisect_right(self.page_offsets, offset)
@@ -0,0 +1,111 @@
+import time
+import asyncio
+import hashlib
+from typing import Optional, Tuple
+import redis.asyncio as aioredis
+
+from core.cache import LRUCache
+from core.config import settings, PIPELINE_VERSION
+from db.redis_store import get_redis, result_cache_key, RESULT_INVALIDATION_CHANNEL
+
+# A cached response: (strong ETag, serialized JSON body)
+CachedResult = Tuple[str, bytes]
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+class ResultCache:
+    """
+    Serialized responses of completed contracts, keyed by contract ID and
+    pipeline version. Completed results only change when a contract is
+    reprocessed, so entries never expire locally. Tier 1 is an in-process LRU,
+    tier 2 an optional Redis copy shared by every API process.
+
+    The worker publishes a contract's ID on RESULT_INVALIDATION_CHANNEL after
+    writing new results; listen() drops the local entry. A response read from
+    MongoDB before an invalidation arrived is not cached.
+    """
+
+    def __init__(self, max_entries: int):
+        self._local = LRUCache(max_entries=max_entries)
+        self._invalidated_at = LRUCache(max_entries=max(max_entries, 1024))
+        self._listener: Optional[asyncio.Task] = None
+
+    def _redis(self) -> Optional[aioredis.Redis]:
+        return get_redis() if settings.RESULT_CACHE_REDIS else None
+
+    async def get(self, contract_id: str) -> Optional[CachedResult]:
+        cached = self._local.get(contract_id)
+        if cached is not None:
+            return cached
+        redis_client = self._redis()
+        if redis_client is None:
+            return None
+        try:
+            value = await redis_client.get(result_cache_key(contract_id, PIPELINE_VERSION))
+        except aioredis.RedisError as e:
+            print(f"Redis result cache lookup failed: {e}")
+            return None
+        if value is None:
+            return None
+        body = value.encode("utf-8")
+        cached = (make_etag(body), body)
+        self._local.set(contract_id, cached)
+        return cached
+
+    async def set(self, contract_id: str, body: bytes, read_started: float) -> CachedResult:
+        """Caches a body read from MongoDB at read_started (time.monotonic()); returns (etag, body)."""
+        cached = (make_etag(body), body)
+        invalidated_at = self._invalidated_at.get(contract_id)
+        if invalidated_at is not None and invalidated_at >= read_started:
+            return cached
+        self._local.set(contract_id, cached)
+        redis_client = self._redis()
+        if redis_client is not None:
+            try:
+                await redis_client.set(result_cache_key(contract_id, PIPELINE_VERSION), body.decode("utf-8"), ex=settings.RESULT_CACHE_REDIS_TTL_SECONDS)
+            except aioredis.RedisError as e:
+                print(f"Redis result cache write failed: {e}")
+        return cached
+
+    def invalidate(self, contract_id: str):
+        self._local.pop(contract_id)
+        self._invalidated_at.set(contract_id, time.monotonic())
+
+    async def listen(self):
+        """Drops local entries as the worker announces new results; reconnects on Redis errors."""
+        while True:
+            redis_client = get_redis()
+            if redis_client is None:
+                return
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(RESULT_INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.invalidate(message["data"])
+            except aioredis.RedisError as e:
+                # Anything announced while disconnected is missed, so start over empty
+                print(f"Result cache invalidation listener lost Redis, retrying: {e}")
+                self._local.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.close()
+
+    def start(self):
+        if self._listener is None:
+            self._listener = asyncio.create_task(self.listen())
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+
+result_cache = ResultCache(max_entries=settings.RESULT_CACHE_MAX_ENTRIES)
@@ -0,0 +1,51 @@
+import re
+from typing import Any, Dict, List
+
+# extracted_data sections whose values are indexed as clause text
+CLAUSE_SECTIONS = ["payment_structure", "revenue_classification"]
+
+
+def build_search_content(file_name: str, extracted_data: Dict[str, Any]) -> str:
+    """Builds the space-separated keyword string stored on each contract for search."""
+    search_keywords = []
+    # 1. Sanitize and add the filename
+    # Replace non-alphanumeric characters with spaces
+    sanitized_filename = re.sub(r'[^a-zA-Z0-9]', ' ', file_name or "")
+    search_keywords.append(sanitized_filename)
+
+    # 2. Add extracted party names
+    parties = (extracted_data or {}).get("party_identification") or {}
+    customer_raw = (parties.get("customer") or {}).get("value")
+    vendor_raw = (parties.get("vendor") or {}).get("value")
+
+    if customer_raw:
+        # Clean the string: remove newlines and other non-alphanumeric chars
+        sanitized_customer = re.sub(r'[^a-zA-Z0-9\s]', '', customer_raw)
+        search_keywords.append(sanitized_customer.strip())
+    if vendor_raw:
+        sanitized_vendor = re.sub(r'[^a-zA-Z0-9\s]', '', vendor_raw)
+        search_keywords.append(sanitized_vendor.strip())
+
+    # Join everything into a single, space-separated string
+    return " ".join(filter(None, search_keywords))
+
+
+def _collect_strings(value: Any, out: List[str]):
+    if isinstance(value, str):
+        out.append(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_strings(item, out)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_strings(item, out)
+
+
+def build_clause_text(extracted_data: Dict[str, Any]) -> str:
+    """Concatenates the extracted clause values (payment, billing, renewal) for the text index."""
+    texts = []
+    for section in CLAUSE_SECTIONS:
+        for field in ((extracted_data or {}).get(section) or {}).values():
+            if field:
+                _collect_strings(field.get("value"), texts)
+    return " ".join(t.strip().replace("\n", " ") for t in texts if t and t.strip())
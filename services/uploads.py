@@ -0,0 +1,148 @@
+import os
+import uuid
+import hashlib
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, List, Tuple, Union
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from core.config import settings
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz")
+
+
+class UploadTooLargeError(Exception):
+    def __init__(self, max_bytes: int):
+        super().__init__(f"File exceeds the maximum upload size of {max_bytes} bytes.")
+        self.max_bytes = max_bytes
+
+
+class StoredUpload:
+    def __init__(self, path: Path, size: int, sha256: str, already_stored: bool):
+        self.path = path
+        self.size = size
+        self.sha256 = sha256
+        self.already_stored = already_stored  # identical bytes were already on disk
+
+
+def content_path(dest_dir: Path, sha256: str) -> Path:
+    return dest_dir / f"{sha256}.pdf"
+
+
+class _ContentAddressedWriter:
+    """
+    Writes one file into dest_dir, hashing and size-checking each chunk. Data
+    lands in a temporary file in the same directory and, on commit, is either
+    discarded (those bytes are already stored) or atomically renamed to
+    <sha256>.pdf, so readers never see a partial file.
+    """
+
+    def __init__(self, dest_dir: Path, max_bytes: int):
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        self.dest_dir = dest_dir
+        self.max_bytes = max_bytes
+        self.tmp_path = dest_dir / f".{uuid.uuid4().hex}.part"
+        self.hasher = hashlib.sha256()
+        self.size = 0
+        self.buffer: BinaryIO = open(self.tmp_path, "wb")
+
+    def write(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadTooLargeError(self.max_bytes)
+        self.hasher.update(chunk)
+        self.buffer.write(chunk)
+
+    def commit(self) -> StoredUpload:
+        self.buffer.flush()
+        os.fsync(self.buffer.fileno())
+        self.buffer.close()
+        sha256 = self.hasher.hexdigest()
+        dest_path = content_path(self.dest_dir, sha256)
+        already_stored = dest_path.exists()
+        if already_stored:
+            self.tmp_path.unlink()
+        else:
+            os.replace(self.tmp_path, dest_path)
+        return StoredUpload(path=dest_path, size=self.size, sha256=sha256, already_stored=already_stored)
+
+    def abort(self):
+        self.buffer.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+async def stream_upload_to_disk(file: UploadFile, dest_dir: Path, max_bytes: int = None) -> StoredUpload:
+    """
+    Copies an upload into dest_dir in chunks without holding it in memory.
+
+    Size and SHA-256 are computed while copying, and the file is rejected once
+    it crosses max_bytes. Storage is content-addressed (<sha256>.pdf), so
+    identical files are kept once. Blocking file I/O runs in the threadpool,
+    off the event loop. Starlette has already spooled the request body by the
+    time this runs; oversized requests are refused before that by
+    core/request_limits.py.
+    """
+    max_bytes = settings.MAX_UPLOAD_BYTES if max_bytes is None else max_bytes
+
+    writer = await run_in_threadpool(_ContentAddressedWriter, dest_dir, max_bytes)
+    try:
+        while chunk := await file.read(settings.UPLOAD_CHUNK_BYTES):
+            await run_in_threadpool(writer.write, chunk)
+        return await run_in_threadpool(writer.commit)
+    except BaseException:
+        writer.abort()
+        raise
+
+
+def store_fileobj(fileobj: BinaryIO, dest_dir: Path, max_bytes: int = None) -> StoredUpload:
+    """Blocking counterpart of stream_upload_to_disk for file objects such as archive members."""
+    max_bytes = settings.MAX_UPLOAD_BYTES if max_bytes is None else max_bytes
+    writer = _ContentAddressedWriter(dest_dir, max_bytes)
+    try:
+        while chunk := fileobj.read(settings.UPLOAD_CHUNK_BYTES):
+            writer.write(chunk)
+        return writer.commit()
+    except BaseException:
+        writer.abort()
+        raise
+
+
+def is_archive(file_name: str) -> bool:
+    return (file_name or "").lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def extract_archive_pdfs(fileobj: BinaryIO, archive_name: str, dest_dir: Path, max_files: int) -> List[Tuple[str, Union[StoredUpload, str]]]:
+    """
+    Unpacks the PDFs in a zip or tar archive straight into content-addressed
+    storage, one member at a time, decompressing in chunks. Returns
+    (member name, StoredUpload or rejection reason) per PDF member. Blocking.
+    """
+    results = []
+    stored = 0
+
+    def store(name: str, open_member):
+        nonlocal stored
+        if stored >= max_files:
+            results.append((name, f"Batch limit of {max_files} files reached."))
+            return
+        try:
+            with open_member() as member:
+                results.append((name, store_fileobj(member, dest_dir)))
+            stored += 1
+        except UploadTooLargeError as e:
+            results.append((name, str(e)))
+
+    if archive_name.lower().endswith(".zip"):
+        with zipfile.ZipFile(fileobj) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and info.filename.lower().endswith(".pdf"):
+                    store(info.filename, lambda info=info: archive.open(info))
+    else:
+        # Stream mode: members are read in order without seeking
+        with tarfile.open(fileobj=fileobj, mode="r|*") as archive:
+            for info in archive:
+                if info.isfile() and info.name.lower().endswith(".pdf"):
+                    store(info.name, lambda info=info: archive.extractfile(info))
+    return results
@@ -0,0 +1,18 @@
+from celery import Celery
+from core.config import settings
+
+# Kept free of processing imports so the API can enqueue tasks by name without
+# loading the NLP pipeline; the tasks themselves live in tasks/celery_worker.py.
+PROCESS_CONTRACT_TASK = "tasks.process_contract"
+PROCESS_CONTRACT_BATCH_TASK = "tasks.process_contract_batch"  # several contracts per task; party NER goes through nlp.pipe
+
+celery_app = Celery("tasks", broker=settings.REDIS_URI, backend=settings.REDIS_URI)
+celery_app.conf.update(
+    task_serializer='json', result_serializer='json', accept_content=['json'],
+    # Pool children load and warm the models during init, which takes far longer than Celery's 4s default
+    worker_proc_alive_timeout=settings.WORKER_PROC_ALIVE_TIMEOUT,
+    worker_concurrency=settings.WORKER_CONCURRENCY or None,
+    worker_max_tasks_per_child=settings.WORKER_MAX_TASKS_PER_CHILD or None,
+    # Contracts take seconds each: don't let one child hoard queued work while others idle
+    worker_prefetch_multiplier=1,
+)
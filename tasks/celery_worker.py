@@ -1,16 +1,31 @@
 from pathlib import Path
-from celery import Celery
-from core.config import settings
-from pymongo import MongoClient
-import re
-from services.contract_processor import analyze_contract_advanced
+from db.worker_mongodb import get_worker_collection, worker_pool_metrics
 import os
+from core.config import PIPELINE_VERSION
+from tasks.celery_app import celery_app, PROCESS_CONTRACT_TASK, PROCESS_CONTRACT_BATCH_TASK
+from tasks.progress import ProgressReporter
+from services.search_content import build_search_content, build_clause_text
+from services.field_summary import summarize_extracted_fields
+import tasks.worker_lifecycle  # connects the warm-up / readiness signal handlers
 
-celery_app = Celery("tasks", broker=settings.REDIS_URI, backend=settings.REDIS_URI)
-celery_app.conf.update(task_serializer='json', result_serializer='json', accept_content=['json'])
 
-@celery_app.task(name="tasks.process_contract")
-def process_contract_task(contract_id: str, file_path: str):
+def build_result_fields(analysis_result: dict, file_path: str, file_name: str = None) -> dict:
+    """Everything written to the contract document on completion."""
+    search_content_string = build_search_content(file_name or Path(file_path).name, analysis_result.get("extracted_data", {}))
+    return {
+        "extracted_data": analysis_result["extracted_data"],
+        "identified_gaps": analysis_result["identified_gaps"],
+        "gaps_count": len(analysis_result.get("identified_gaps", [])),
+        "search_content": search_content_string,
+        "clause_text": build_clause_text(analysis_result.get("extracted_data", {})),
+        "processing_metrics": analysis_result.get("metrics", {}),
+        "pipeline_version": PIPELINE_VERSION,
+        # Indexed filter fields: min/avg confidence and present_fields_mask
+        **summarize_extracted_fields(analysis_result.get("extracted_data", {}))
+    }
+
+@celery_app.task(name=PROCESS_CONTRACT_TASK)
+def process_contract_task(contract_id: str, file_path: str, file_name: str = None):
     """
     The background task that uses the advanced, scalable processing pipeline.
     """
@@ -18,78 +33,33 @@ def process_contract_task(contract_id: str, file_path: str):
     print(f"Processing contract_id: {contract_id}")
     print(f"File path: {file_path}")
     
+    # Process-wide pooled client, opened at worker init (see tasks/worker_lifecycle.py)
+    contracts_collection = get_worker_collection("contracts")
+    progress = ProgressReporter(contract_id, contracts_collection)
+
     try:
-        # Test MongoDB connection first
-        print("Testing MongoDB connection...")
-        mongo_client = MongoClient(settings.MONGO_URI)
-        db = mongo_client[settings.MONGO_DB_NAME]
-        contracts_collection = db["contracts"]
-        print(f"MongoDB connected successfully. Database: {settings.MONGO_DB_NAME}")
-        
         # Test file existence
         print(f"Checking if file exists: {file_path}")
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
         print("File exists, proceeding with analysis...")
         
-        def update_progress(percentage: int, message: str):
-            contracts_collection.update_one(
-                {"contract_id": contract_id},
-                {"$set": {"progress_percentage": percentage, "progress_message": message}}
-            )
-            print(f"[{contract_id}] Progress: {percentage}% - {message}")
-
-        update_progress(10, "Starting contract analysis...")
+        progress.update(10, "Starting contract analysis...")
         
-        # Test model loading
-        print("Testing model loading...")
+        # Models are normally warm already (see tasks/worker_lifecycle.py); otherwise they load on first use
         from services.contract_processor import analyze_contract_advanced
-        print("Contract processor imported successfully")
         
-        update_progress(20, "Loading NLP models...")
+        # Analysis takes seconds: publish this step now rather than letting the throttle hold it back
+        progress.update(20, "Loading NLP models...", force=True)
         analysis_result = analyze_contract_advanced(file_path)
         print("Analysis completed successfully")
 
-        update_progress(90, "Finalizing analysis and saving results...")
+        progress.update(90, "Finalizing analysis and saving results...")
 
-        search_keywords = []
-        # 1. Sanitize and add the filename
-        original_filename = Path(file_path).name
-        # Replace non-alphanumeric characters with spaces
-        sanitized_filename = re.sub(r'[^a-zA-Z0-9]', ' ', original_filename)
-        search_keywords.append(sanitized_filename)
+        result_fields = build_result_fields(analysis_result, file_path, file_name)
+        print(f"DEBUG: Generated search_content for {contract_id}: '{result_fields['search_content']}'")
 
-        # 2. Add extracted party names
-        extracted = analysis_result.get("extracted_data", {})
-        customer_raw = extracted.get("party_identification", {}).get("customer", {}).get("value")
-        vendor_raw = extracted.get("party_identification", {}).get("vendor", {}).get("value")
-        
-        if customer_raw:
-            # Clean the string: remove newlines and other non-alphanumeric chars
-            sanitized_customer = re.sub(r'[^a-zA-Z0-9\s]', '', customer_raw)
-            search_keywords.append(sanitized_customer.strip())
-        if vendor_raw:
-            sanitized_vendor = re.sub(r'[^a-zA-Z0-9\s]', '', vendor_raw)
-            search_keywords.append(sanitized_vendor.strip())
-        # Join everything into a single, space-separated string
-        
-        search_content_string = " ".join(filter(None, search_keywords))
-        print(f"DEBUG: Generated search_content for {contract_id}: '{search_content_string}'")
-
-        gaps_count = len(analysis_result.get("identified_gaps", []))
-
-        final_update = {
-            "$set": {
-                "processing_status": "completed",
-                "progress_percentage": 100,
-                "progress_message": "Processing complete.",
-                "extracted_data": analysis_result["extracted_data"],
-                "identified_gaps": analysis_result["identified_gaps"],
-                "gaps_count": gaps_count,
-                "search_content": search_content_string 
-            }
-        }
-        contracts_collection.update_one({"contract_id": contract_id}, final_update)
+        progress.complete(result_fields)
         print(f"Successfully processed contract_id: {contract_id}")
 
     except Exception as e:
@@ -100,21 +70,58 @@ def process_contract_task(contract_id: str, file_path: str):
         print(f"Traceback: {traceback.format_exc()}")
         
         try:
-            contracts_collection.update_one(
-                {"contract_id": contract_id},
-                {"$set": {
-                    "processing_status": "error",
-                    "progress_percentage": 100,
-                    "progress_message": "Processing failed.",
-                    "error_message": error_msg,
-                }}
-            )
+            progress.fail(error_msg)
         except Exception as update_error:
             print(f"Failed to update error status: {update_error}")
     finally:
+        print(f"Mongo pool metrics: {worker_pool_metrics()}")
+
+    return {"contract_id": contract_id, "status": "processing_finished"}
+
+@celery_app.task(name=PROCESS_CONTRACT_BATCH_TASK)
+def process_contract_batch_task(contracts: list):
+    """
+    Processes several contracts ([contract_id, file_path, file_name] each) in
+    one task, so their party NER runs through a single nlp.pipe call. Every
+    contract is then analyzed, timed and completed or failed on its own.
+    """
+    print(f"=== CELERY BATCH TASK STARTED: {len(contracts)} contracts ===")
+    contracts_collection = get_worker_collection("contracts")
+    pending = []
+    for contract_id, file_path, file_name in contracts:
+        if not os.path.exists(file_path):
+            ProgressReporter(contract_id, contracts_collection).fail(f"An error occurred: File not found: {file_path}")
+            continue
+        pending.append((contract_id, file_path, file_name))
+
+    # Only parsing and the shared party NER run up front; the rest of the
+    # pipeline runs per contract, so each one is timed and completed on its own
+    try:
+        if pending:
+            from services.contract_processor import prepare_contracts_batch
+            prepared = prepare_contracts_batch([file_path for _, file_path, _ in pending])
+        else:
+            prepared = []
+    except Exception as e:
+        # Models unavailable: nothing in the batch can be processed
+        prepared = [(e, None)] * len(pending)
+
+    for (contract_id, file_path, file_name), (processor, preamble_orgs) in zip(pending, prepared):
+        progress = ProgressReporter(contract_id, contracts_collection)
         try:
-            mongo_client.close()
-        except:
-            pass
+            if isinstance(processor, Exception):
+                raise processor
+            progress.update(10, "Starting contract analysis...")
+            result = processor.process(preamble_orgs=preamble_orgs)
+            progress.update(90, "Finalizing analysis and saving results...")
+            progress.complete(build_result_fields(result, file_path, file_name))
+            print(f"Successfully processed contract_id: {contract_id}")
+        except Exception as e:
+            print(f"ERROR processing contract {contract_id}: {e}")
+            try:
+                progress.fail(f"An error occurred: {str(e)}")
+            except Exception as update_error:
+                print(f"Failed to update error status: {update_error}")
 
-    return {"contract_id": contract_id, "status": "processing_finished"}
\ No newline at end of file
+    print(f"Mongo pool metrics: {worker_pool_metrics()}")
+    return {"contracts": [c[0] for c in contracts], "status": "processing_finished"}
@@ -0,0 +1,135 @@
+import os
+import json
+import time
+from datetime import datetime
+from typing import Optional
+import redis
+from core.config import settings, PIPELINE_VERSION
+from db.redis_store import progress_key, events_channel, result_cache_key, RESULT_INVALIDATION_CHANNEL
+from services.daily_stats import STATS_COLLECTION, stats_day, build_daily_stats_update
+
+
+class _WorkerRedis:
+    client: redis.Redis = None
+    pid: int = None
+
+_worker_redis = _WorkerRedis()
+
+def get_worker_redis() -> redis.Redis:
+    # One client per worker process; rebuilt after fork
+    if _worker_redis.client is None or _worker_redis.pid != os.getpid():
+        _worker_redis.client = redis.Redis.from_url(settings.REDIS_URI, decode_responses=True)
+        _worker_redis.pid = os.getpid()
+    return _worker_redis.client
+
+
+class ProgressReporter:
+    """
+    Reports processing progress for one contract.
+
+    Intermediate updates go to Redis, throttled to one write per
+    PROGRESS_MIN_INTERVAL_SECONDS. An update inside the window is held back and
+    replaced by the next one; nothing writes it later on its own. Pass
+    force=True (or call flush()) before a long-running step so its message is
+    published while the step runs. Each Redis write is also published on the
+    contract's events channel for the streaming status endpoint. MongoDB is
+    written once, on the terminal state. If Redis is unavailable, intermediate
+    updates fall back to MongoDB.
+    """
+
+    def __init__(self, contract_id: str, collection, min_interval: Optional[float] = None):
+        self.contract_id = contract_id
+        self.collection = collection
+        self.min_interval = settings.PROGRESS_MIN_INTERVAL_SECONDS if min_interval is None else min_interval
+        self._last_write = None
+        self._pending = None
+        self.started_at = datetime.utcnow()
+        self._started = time.monotonic()
+        self.writes = {"redis": 0, "mongo": 0, "coalesced": 0}
+
+    def update(self, percentage: int, message: str, force: bool = False):
+        print(f"[{self.contract_id}] Progress: {percentage}% - {message}")
+        self._pending = {"status": "processing", "progress_percentage": percentage, "progress_message": message, "error_message": None}
+        now = time.monotonic()
+        if not force and self._last_write is not None and now - self._last_write < self.min_interval:
+            self.writes["coalesced"] += 1
+            return
+        self.flush()
+
+    def flush(self):
+        if self._pending is None:
+            return
+        if not self._write_fast(self._pending):
+            self.collection.update_one(
+                {"contract_id": self.contract_id},
+                {"$set": {"progress_percentage": self._pending["progress_percentage"], "progress_message": self._pending["progress_message"]}}
+            )
+            self.writes["mongo"] += 1
+        self._pending = None
+        self._last_write = time.monotonic()
+
+    def complete(self, result_fields: dict):
+        """Writes the completed state and results to MongoDB, then to the fast store."""
+        state = {"status": "completed", "progress_percentage": 100, "progress_message": "Processing complete.", "error_message": None}
+        self._finish(state, result_fields)
+
+    def fail(self, error_message: str):
+        state = {"status": "error", "progress_percentage": 100, "progress_message": "Processing failed.", "error_message": error_message}
+        self._finish(state, {})
+
+    def _finish(self, state: dict, extra_fields: dict):
+        self._pending = None
+        processed_at = datetime.utcnow()
+        processing_seconds = round(time.monotonic() - self._started, 3)
+        self.collection.update_one(
+            {"contract_id": self.contract_id},
+            {"$set": {
+                "processing_status": state["status"],
+                "progress_percentage": state["progress_percentage"],
+                "progress_message": state["progress_message"],
+                "error_message": state["error_message"],
+                "processing_started_at": self.started_at,
+                "processed_at": processed_at,
+                "processing_seconds": processing_seconds,
+                **extra_fields,
+            }}
+        )
+        self.writes["mongo"] += 1
+        self._write_fast(state)
+        self._invalidate_cached_result()
+        self._record_daily_stats(state["status"], extra_fields, processed_at, processing_seconds)
+        print(f"[{self.contract_id}] Progress writes: {self.writes}")
+
+    def _record_daily_stats(self, status: str, fields: dict, processed_at: datetime, processing_seconds: float):
+        # Best effort: the dashboard counters must never fail the task itself
+        try:
+            self.collection.database[STATS_COLLECTION].update_one(
+                {"_id": stats_day(processed_at)},
+                build_daily_stats_update(status, fields.get("identified_gaps"), fields.get("avg_confidence"), processing_seconds),
+                upsert=True,
+            )
+        except Exception as e:
+            print(f"[{self.contract_id}] Could not update daily stats: {e}")
+
+    def _invalidate_cached_result(self):
+        # The API caches completed responses (services/result_cache.py); a reprocessed contract must not serve the old one
+        try:
+            pipe = get_worker_redis().pipeline(transaction=False)
+            pipe.delete(result_cache_key(self.contract_id, PIPELINE_VERSION))
+            pipe.publish(RESULT_INVALIDATION_CHANNEL, self.contract_id)
+            pipe.execute()
+        except redis.RedisError as e:
+            print(f"[{self.contract_id}] Could not invalidate the cached result: {e}")
+
+    def _write_fast(self, state: dict) -> bool:
+        payload = json.dumps(state)
+        try:
+            pipe = get_worker_redis().pipeline(transaction=False)
+            pipe.set(progress_key(self.contract_id), payload, ex=settings.PROGRESS_TTL_SECONDS)
+            pipe.publish(events_channel(self.contract_id), json.dumps({"contract_id": self.contract_id, **state}))
+            pipe.execute()
+        except redis.RedisError as e:
+            print(f"[{self.contract_id}] Redis progress write failed: {e}")
+            return False
+        self.writes["redis"] += 1
+        return True
@@ -0,0 +1,162 @@
+import gc
+import os
+import sys
+import json
+import socket
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import redis
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown, worker_shutdown
+
+from core.config import settings
+from db.worker_mongodb import connect_worker_mongo, close_worker_mongo
+
+# Signal handlers that get every worker process warm before it takes traffic.
+# Pool children (prefork) warm up in worker_process_init; pools that run tasks in
+# the main process (solo, threads) warm up in worker_init, before consuming starts.
+# With prefork the parent loads the models before forking, so every child maps the
+# same read-only weights copy-on-write instead of holding its own copy.
+
+
+def _pool_name(worker) -> str:
+    pool_cls = getattr(worker, "pool_cls", None)
+    if pool_cls is None:
+        return str(worker.app.conf.worker_pool) if worker is not None else ""
+    return pool_cls if isinstance(pool_cls, str) else pool_cls.__module__
+
+
+def _ready_key() -> str:
+    return f"{settings.WORKER_READY_KEY_PREFIX}:{socket.gethostname()}:{os.getpid()}"
+
+
+class _Heartbeat:
+    stop: threading.Event = None
+
+_heartbeat = _Heartbeat()
+
+
+def _publish_ready(client: redis.Redis):
+    payload = json.dumps({"pid": os.getpid(), "ready_at": datetime.utcnow().isoformat()})
+    client.set(_ready_key(), payload, ex=settings.WORKER_READY_TTL_SECONDS)
+
+
+def _refresh_ready(stop: threading.Event):
+    # Keeps the key alive while this process is; a killed process stops refreshing and its key expires
+    client = redis.Redis.from_url(settings.REDIS_URI)
+    while not stop.wait(settings.WORKER_READY_TTL_SECONDS / 3):
+        try:
+            _publish_ready(client)
+        except redis.RedisError as e:
+            print(f"Could not refresh readiness in Redis: {e}")
+    client.close()
+
+
+def mark_ready():
+    if settings.WORKER_READY_FILE:
+        try:
+            Path(settings.WORKER_READY_FILE).touch()
+        except OSError as e:
+            print(f"Could not write readiness file {settings.WORKER_READY_FILE}: {e}")
+    if settings.WORKER_READY_KEY_PREFIX:
+        try:
+            client = redis.Redis.from_url(settings.REDIS_URI)
+            _publish_ready(client)
+            client.close()
+        except redis.RedisError as e:
+            print(f"Could not publish readiness to Redis: {e}")
+        _heartbeat.stop = threading.Event()
+        threading.Thread(target=_refresh_ready, args=(_heartbeat.stop,), name="worker-ready-heartbeat", daemon=True).start()
+    print(f"Worker process {os.getpid()} is ready.")
+
+
+def clear_ready():
+    if _heartbeat.stop is not None:
+        _heartbeat.stop.set()
+    if settings.WORKER_READY_KEY_PREFIX:
+        try:
+            client = redis.Redis.from_url(settings.REDIS_URI)
+            client.delete(_ready_key())
+            client.close()
+        except redis.RedisError as e:
+            print(f"Could not clear readiness in Redis: {e}")
+
+
+def clear_ready_file():
+    """Removes a readiness file left behind by a worker that was killed before it could clean up."""
+    if settings.WORKER_READY_FILE:
+        Path(settings.WORKER_READY_FILE).unlink(missing_ok=True)
+
+
+def cap_torch_threads():
+    """Limits intra-op threads so N pool children don't oversubscribe the CPUs."""
+    threads = settings.TORCH_THREADS_PER_CHILD
+    if threads <= 0:
+        return
+    # Read by OpenMP/MKL when torch is first imported; children inherit them
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    # HF tokenizers' own thread pool does not survive fork
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    if "torch" in sys.modules:
+        sys.modules["torch"].set_num_threads(threads)
+
+
+def preload_models_for_fork():
+    """
+    Loads the model weights in the pool parent. No inference runs here: the
+    prototype matrix (read from EMBEDDINGS_CACHE_DIR, or encoded if that is
+    cold) and the warm-up run happen in each child, after fork.
+    """
+    from services.model_registry import get_nlp, get_semantic_model
+    if not get_nlp() or not get_semantic_model():
+        print("Model preload failed; pool children will load models themselves.")
+        return
+    # Move everything loaded so far out of the GC's reach, so collections in the
+    # children don't write to (and thereby copy) the shared pages.
+    gc.freeze()
+    print("Models preloaded in the pool parent.")
+
+
+def prepare_process():
+    """Opens this process's MongoDB pool, loads and warms the NLP pipeline, then reports readiness."""
+    connect_worker_mongo()
+    if settings.WORKER_WARM_UP:
+        from services.contract_processor import warm_up
+        if not warm_up():
+            # Stay un-ready; tasks will still try to load models lazily and report the failure
+            print("Worker warm-up failed: a required NLP model could not be loaded.")
+            return
+    mark_ready()
+
+
+@worker_init.connect
+def _on_worker_init(sender=None, **kwargs):
+    # A container restarted after a SIGKILL/OOM still has the old file; not ready until warm again
+    clear_ready_file()
+    if "prefork" not in _pool_name(sender):
+        prepare_process()
+        return
+    cap_torch_threads()
+    if settings.WORKER_PRELOAD_MODELS:
+        preload_models_for_fork()
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**kwargs):
+    cap_torch_threads()
+    prepare_process()
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**kwargs):
+    clear_ready()
+    close_worker_mongo()
+
+
+@worker_shutdown.connect
+def _on_worker_shutdown(**kwargs):
+    clear_ready()
+    close_worker_mongo()
+    clear_ready_file()